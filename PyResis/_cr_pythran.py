@@ -0,0 +1,49 @@
+"""
+Batch trilinear interpolation of the residual resistance coefficient grid, meant to be compiled with Pythran:
+
+    pythran -O3 -march=native PyResis/_cr_pythran.py -o PyResis/_cr_pythran.so
+
+The compiled extension takes precedence over this file on import. Without it this module is plain Python and
+:class:`PyResis.interpolation.GridInterpolator` evaluates array queries with NumPy instead.
+"""
+# pythran export trilerp(float64[:,:,:], float64[:], float64[:], float64[:], float64[:], float64[:], float64[:])
+import numpy as np
+
+
+def trilerp(grid, axis_0, axis_1, axis_2, x_0, x_1, x_2):
+    """
+    Trilinear interpolation on a rectilinear grid at a batch of points.
+
+    :param grid: (len(axis_0), len(axis_1), len(axis_2)) values on the grid
+    :param axis_0: strictly ascending grid coordinates along the first dimension
+    :param axis_1: strictly ascending grid coordinates along the second dimension
+    :param axis_2: strictly ascending grid coordinates along the third dimension
+    :param x_0: query coordinates along the first dimension
+    :param x_1: query coordinates along the second dimension
+    :param x_2: query coordinates along the third dimension
+    :return: interpolated values, NaN off the grid
+    """
+    cells_0 = np.minimum(np.searchsorted(axis_0, x_0, 'right') - 1, len(axis_0) - 2)
+    cells_1 = np.minimum(np.searchsorted(axis_1, x_1, 'right') - 1, len(axis_1) - 2)
+    cells_2 = np.minimum(np.searchsorted(axis_2, x_2, 'right') - 1, len(axis_2) - 2)
+    values = np.empty(len(x_0))
+    for n in range(len(x_0)):
+        if not (axis_0[0] <= x_0[n] <= axis_0[-1] and axis_1[0] <= x_1[n] <= axis_1[-1] and
+                axis_2[0] <= x_2[n] <= axis_2[-1]):
+            values[n] = np.nan
+            continue
+        i = cells_0[n]
+        j = cells_1[n]
+        k = cells_2[n]
+        a = (x_0[n] - axis_0[i]) / (axis_0[i + 1] - axis_0[i])
+        b = (x_1[n] - axis_1[j]) / (axis_1[j + 1] - axis_1[j])
+        c = (x_2[n] - axis_2[k]) / (axis_2[k + 1] - axis_2[k])
+        values[n] = ((1 - a) * (1 - b) * (1 - c) * grid[i, j, k] +
+                     (1 - a) * (1 - b) * c * grid[i, j, k + 1] +
+                     (1 - a) * b * (1 - c) * grid[i, j + 1, k] +
+                     (1 - a) * b * c * grid[i, j + 1, k + 1] +
+                     a * (1 - b) * (1 - c) * grid[i + 1, j, k] +
+                     a * (1 - b) * c * grid[i + 1, j, k + 1] +
+                     a * b * (1 - c) * grid[i + 1, j + 1, k] +
+                     a * b * c * grid[i + 1, j + 1, k + 1])
+    return values
@@ -0,0 +1,228 @@
+"""
+Compiled kernels for the resistance hot path.
+
+Numba is an optional dependency, without it the kernels run as plain Python functions.
+"""
+import math
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Callable, Tuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from PyResis.constants import GRAVITY
+
+Function = TypeVar('Function', bound=Callable[..., Any])
+Value = TypeVar('Value', float, npt.NDArray[np.float64])
+
+
+def _njit(*_args: Any, **_kwargs: Any) -> Callable[[Function], Function]:
+    """
+    Stand-in for :func:`numba.njit` when numba is not installed.
+    """
+    return lambda func: func
+
+
+def _vectorize(*_args: Any, **_kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., np.ndarray]]:
+    """
+    Stand-in for :func:`numba.vectorize` when numba is not installed, the kernels are NumPy expressions already.
+    """
+    def decorate(func: Callable[..., Any]) -> Callable[..., np.ndarray]:
+        @wraps(func)
+        def ufunc(*args: Any) -> np.ndarray:
+            return np.asarray(func(*(np.asarray(arg, dtype=np.float64) for arg in args)), dtype=np.float64)
+        return ufunc
+    return decorate
+
+
+if TYPE_CHECKING:
+    # type check the kernels as the plain Python functions they are without numba, whether it is installed or not
+    njit, vectorize = _njit, _vectorize
+    HAVE_NUMBA: bool
+else:
+    try:
+        from numba import njit, vectorize
+        HAVE_NUMBA = True
+    except ImportError:  # pragma: no cover
+        HAVE_NUMBA = False
+        njit, vectorize = _njit, _vectorize
+
+
+@njit(cache=True)
+def ittc_friction_line(log10_reynolds_number: Value) -> Value:
+    """
+    Flat plate frictional resistance coefficient of the ITTC formula, :math:`0.075 / (log_{10}(Re) - 2)^2`.
+    ref: https://ittc.info/media/2021/75-02-02-02.pdf
+
+    :param log10_reynolds_number: :math:`log_{10}` of the Reynolds number of the vehicle, scalar or array
+    :return: Frictional resistance coefficient of the vehicle
+    """
+    log10_re_minus_2 = log10_reynolds_number - 2
+    return 0.075 / (log10_re_minus_2 * log10_re_minus_2)
+
+
+@njit(cache=True)
+def resistance_kernel(log10_length_over_viscosity: float, speed: float, half_rho_surface_area: float,
+                      residual_resistance_coef: float) -> float:
+    """
+    Total resistance of the ship from its speed invariant terms and an already interpolated residual resistance
+    coefficient. Reynolds number is split as :math:`log_{10}(L V / ν) = log_{10}(L / ν) + log_{10}(V)` so only the
+    speed term is evaluated per call.
+
+    :param log10_length_over_viscosity: :math:`log_{10}(L / ν)` of the vehicle length and sea water kinematic viscosity
+    :param speed: m/s speed of the vehicle
+    :param half_rho_surface_area: :math:`ρ S / 2` of the sea water density and wetted surface area of the vehicle
+    :param residual_resistance_coef: residual resistance coefficient of the vehicle
+    :return: newton the resistance of the ship
+    """
+    if speed == 0:
+        return 0.0
+    frictional_resistance_coef = ittc_friction_line(log10_length_over_viscosity + math.log10(speed))
+    return half_rho_surface_area * speed * speed * (frictional_resistance_coef + residual_resistance_coef)
+
+
+def _froude_number(speed: npt.NDArray[np.float64], length: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Element-wise body of :func:`PyResis.vectorized.froude_number`, called with arrays without numba.
+    """
+    return speed / np.sqrt(GRAVITY * length)
+
+
+def _frictional_resistance_coef(length: npt.NDArray[np.float64], speed: npt.NDArray[np.float64],
+                                kinematic_viscosity: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Element-wise body of :func:`PyResis.vectorized.frictional_resistance_coef`, called with arrays without numba.
+    """
+    # a vehicle at rest has no frictional resistance, the friction line is evaluated at 1 m/s rather than at log10(0)
+    at_rest = speed == 0
+    frictional_resistance_coef: npt.NDArray[np.float64] = ittc_friction_line(
+        np.log10(length * (speed + at_rest) / kinematic_viscosity)) * (1 - at_rest)
+    return frictional_resistance_coef
+
+
+# Number of elements from which the element-wise ufuncs run multithreaded, below it waking the threads up costs more
+# than a single thread takes for the whole array
+PARALLEL_SIZE = 2 ** 16
+
+
+@lru_cache(maxsize=2)
+def element_wise_kernels(target: str = 'cpu') -> Tuple[Callable[..., np.ndarray], Callable[..., np.ndarray]]:
+    """
+    Compile the element-wise kernels into ufuncs on first use, compiling them eagerly would add hundreds of
+    milliseconds to every import.
+
+    :param target: numba target of the ufuncs, 'cpu' for single threaded or 'parallel' for multithreaded ones
+    :return: ufuncs of :func:`PyResis.physics.froude_number` taking (speed, length) and of
+        :func:`PyResis.physics.frictional_resistance_coef` taking (length, speed, kinematic viscosity)
+    """
+    froude_number = vectorize(['float64(float64, float64)'], target=target, cache=True)(_froude_number)
+    frictional_resistance_coef = vectorize(['float64(float64, float64, float64)'], target=target,
+                                           cache=True)(_frictional_resistance_coef)
+    return froude_number, frictional_resistance_coef
+
+
+def element_wise_target(*args: Any) -> str:
+    """
+    Numba target of the element-wise ufuncs for the given arguments.
+
+    :param args: arguments of the ufunc call
+    :return: 'parallel' if they broadcast to at least :data:`PARALLEL_SIZE` elements, 'cpu' otherwise
+    """
+    return 'parallel' if np.broadcast(*args).size >= PARALLEL_SIZE else 'cpu'
+
+
+@njit(cache=True)
+def _nearest_index_loop(points, point) -> int:
+    """
+    Index of the data point nearest to the query point by brute force, as a loop for numba.
+
+    :param points: (N, ndim) coordinates of the data points
+    :param point: (ndim,) coordinates of the query point
+    :return: index of the nearest data point, the first one on ties
+    :raises ValueError: if a coordinate of the query point is NaN or infinite
+    """
+    for dimension in range(point.shape[0]):
+        if not math.isfinite(point[dimension]):
+            raise ValueError('query point must be finite')
+    nearest = 0
+    nearest_distance = np.inf
+    for n in range(points.shape[0]):
+        distance = 0.0
+        for dimension in range(points.shape[1]):
+            distance += (points[n, dimension] - point[dimension]) ** 2
+        if distance < nearest_distance:
+            nearest = n
+            nearest_distance = distance
+    return nearest
+
+
+def _nearest_index_numpy(points, point) -> int:
+    """
+    Index of the data point nearest to the query point by brute force, as a NumPy expression for plain Python.
+
+    :param points: (N, ndim) coordinates of the data points
+    :param point: (ndim,) coordinates of the query point
+    :return: index of the nearest data point, the first one on ties
+    :raises ValueError: if a coordinate of the query point is NaN or infinite
+    """
+    if not np.isfinite(point).all():
+        raise ValueError('query point must be finite')
+    return int(np.argmin(((points - point) ** 2).sum(axis=1)))
+
+
+# nearest_index(points, point) returns the index of the first of the (N, ndim) points nearest to the (ndim,) point
+nearest_index = _nearest_index_loop if HAVE_NUMBA else _nearest_index_numpy
+
+
+@njit(cache=True)
+def _grid_cell(axis, coordinate: float, last: int) -> int:
+    """
+    Index of the grid cell containing the coordinate, the last cell is reused when it still contains it.
+
+    :param axis: strictly ascending grid coordinates
+    :param coordinate: query coordinate
+    :param last: index of the previously used cell
+    :return: index i with axis[i] <= coordinate <= axis[i + 1], -1 if the coordinate is off the grid
+    """
+    if axis[last] <= coordinate <= axis[last + 1]:
+        return last
+    if not axis[0] <= coordinate <= axis[-1]:
+        return -1
+    return min(int(np.searchsorted(axis, coordinate, side='right')) - 1, len(axis) - 2)
+
+
+@njit(cache=True)
+def trilerp(grid, axis_0, axis_1, axis_2, x_0: float, x_1: float, x_2: float, last_cell) -> float:
+    """
+    Trilinear interpolation on a rectilinear grid.
+
+    :param grid: (len(axis_0), len(axis_1), len(axis_2)) values on the grid
+    :param axis_0: strictly ascending grid coordinates along the first dimension
+    :param axis_1: strictly ascending grid coordinates along the second dimension
+    :param axis_2: strictly ascending grid coordinates along the third dimension
+    :param x_0: query coordinate along the first dimension
+    :param x_1: query coordinate along the second dimension
+    :param x_2: query coordinate along the third dimension
+    :param last_cell: int64 array of the three cell indices used last, updated in place
+    :return: interpolated value, NaN off the grid
+    """
+    i = _grid_cell(axis_0, x_0, last_cell[0])
+    j = _grid_cell(axis_1, x_1, last_cell[1])
+    k = _grid_cell(axis_2, x_2, last_cell[2])
+    if i < 0 or j < 0 or k < 0:
+        return np.nan
+    last_cell[0] = i
+    last_cell[1] = j
+    last_cell[2] = k
+
+    a = (x_0 - axis_0[i]) / (axis_0[i + 1] - axis_0[i])
+    b = (x_1 - axis_1[j]) / (axis_1[j + 1] - axis_1[j])
+    c = (x_2 - axis_2[k]) / (axis_2[k + 1] - axis_2[k])
+    return float((1 - a) * (1 - b) * (1 - c) * grid[i, j, k] +
+                 (1 - a) * (1 - b) * c * grid[i, j, k + 1] +
+                 (1 - a) * b * (1 - c) * grid[i, j + 1, k] +
+                 (1 - a) * b * c * grid[i, j + 1, k + 1] +
+                 a * (1 - b) * (1 - c) * grid[i + 1, j, k] +
+                 a * (1 - b) * c * grid[i + 1, j, k + 1] +
+                 a * b * (1 - c) * grid[i + 1, j + 1, k] +
+                 a * b * c * grid[i + 1, j + 1, k + 1])
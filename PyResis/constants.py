@@ -1,1891 +1,50 @@
+import os
+from functools import lru_cache
+from typing import Any
+
 import numpy as np
-from scipy import interpolate
 
-CRLIST = np.array([[4.00000, 0.50000, 0.15000, 0.83526],
-                   [4.00000, 0.55000, 0.14999, 0.81825],
-                   [4.00000, 0.60000, 0.15869, 0.88312],
-                   [4.00000, 0.65000, 0.15815, 0.87704],
-                   [4.00000, 0.70000, 0.15805, 0.87194],
-                   [4.00000, 0.75000, 0.15888, 1.06366],
-                   [4.00000, 0.80000, 0.15799, 1.31708],
-                   [4.00000, 0.50000, 0.15500, 0.86728],
-                   [4.00000, 0.55000, 0.15600, 0.85303],
-                   [4.00000, 0.60000, 0.17583, 0.98366],
-                   [4.00000, 0.65000, 0.17519, 0.97240],
-                   [4.00000, 0.70000, 0.17519, 1.00621],
-                   [4.00000, 0.75000, 0.17601, 1.23345],
-                   [4.00000, 0.80000, 0.17354, 1.58493],
-                   [4.00000, 0.50000, 0.16000, 0.89117],
-                   [4.00000, 0.55000, 0.16200, 0.88996],
-                   [4.00000, 0.60000, 0.19297, 1.11095],
-                   [4.00000, 0.65000, 0.19232, 1.13288],
-                   [4.00000, 0.70000, 0.19231, 1.19934],
-                   [4.00000, 0.75000, 0.19273, 1.46650],
-                   [4.00000, 0.80000, 0.18789, 1.90867],
-                   [4.00000, 0.50000, 0.16500, 0.92848],
-                   [4.00000, 0.55000, 0.16800, 0.92929],
-                   [4.00000, 0.60000, 0.20945, 1.29377],
-                   [4.00000, 0.65000, 0.20945, 1.35363],
-                   [4.00000, 0.70000, 0.20943, 1.45508],
-                   [4.00000, 0.75000, 0.20886, 1.77690],
-                   [4.00000, 0.80000, 0.19982, 2.27302],
-                   [4.00000, 0.50000, 0.17000, 0.96777],
-                   [4.00000, 0.55000, 0.17400, 0.96260],
-                   [4.00000, 0.60000, 0.22593, 1.54633],
-                   [4.00000, 0.65000, 0.22534, 1.62495],
-                   [4.00000, 0.70000, 0.22446, 1.77036],
-                   [4.00000, 0.75000, 0.22324, 2.12371],
-                   [4.00000, 0.80000, 0.20877, 2.66879],
-                   [4.00000, 0.50000, 0.17500, 1.00155],
-                   [4.00000, 0.55000, 0.18000, 0.99887],
-                   [4.00000, 0.60000, 0.24175, 1.88470],
-                   [4.00000, 0.65000, 0.23942, 1.98440],
-                   [4.00000, 0.70000, 0.23611, 2.08925],
-                   [4.00000, 0.75000, 0.23173, 2.41027],
-                   [4.00000, 0.80000, 0.21494, 2.99509],
-                   [4.00000, 0.50000, 0.18000, 1.04692],
-                   [4.00000, 0.55000, 0.18600, 1.04801],
-                   [4.00000, 0.60000, 0.25243, 2.17914],
-                   [4.00000, 0.65000, 0.25062, 2.33418],
-                   [4.00000, 0.70000, 0.24499, 2.44526],
-                   [4.00000, 0.75000, 0.23740, 2.68804],
-                   [4.00000, 0.80000, 0.21993, 3.31261],
-                   [4.00000, 0.50000, 0.18500, 1.08757],
-                   [4.00000, 0.55000, 0.19200, 1.09043],
-                   [4.00000, 0.60000, 0.26193, 2.49980],
-                   [4.00000, 0.65000, 0.25884, 2.66467],
-                   [4.00000, 0.70000, 0.25248, 2.82434],
-                   [4.00000, 0.75000, 0.24273, 2.99142],
-                   [4.00000, 0.80000, 0.22405, 3.61863],
-                   [4.00000, 0.50000, 0.19000, 1.13190],
-                   [4.00000, 0.55000, 0.19800, 1.13521],
-                   [4.00000, 0.60000, 0.26971, 2.81443],
-                   [4.00000, 0.65000, 0.26514, 2.99987],
-                   [4.00000, 0.70000, 0.25765, 3.14677],
-                   [4.00000, 0.75000, 0.24737, 3.30127],
-                   [4.00000, 0.80000, 0.22769, 3.92082],
-                   [4.00000, 0.50000, 0.19500, 1.18791],
-                   [4.00000, 0.55000, 0.20400, 1.20420],
-                   [4.00000, 0.60000, 0.27638, 3.10867],
-                   [4.00000, 0.65000, 0.27077, 3.34001],
-                   [4.00000, 0.70000, 0.26265, 3.48641],
-                   [4.00000, 0.75000, 0.25172, 3.68987],
-                   [4.00000, 0.80000, 0.23039, 4.16804],
-                   [4.00000, 0.50000, 0.20000, 1.24433],
-                   [4.00000, 0.55000, 0.21000, 1.26070],
-                   [4.00000, 0.60000, 0.28212, 3.35558],
-                   [4.00000, 0.65000, 0.27566, 3.67485],
-                   [4.00000, 0.70000, 0.26652, 3.82470],
-                   [4.00000, 0.75000, 0.25500, 3.99957],
-                   [4.00000, 0.80000, 0.23298, 4.40903],
-                   [4.00000, 0.50000, 0.20500, 1.28729],
-                   [4.00000, 0.55000, 0.21600, 1.31263],
-                   [4.00000, 0.60000, 0.28793, 3.60486],
-                   [4.00000, 0.65000, 0.27998, 4.03254],
-                   [4.00000, 0.70000, 0.26979, 4.15798],
-                   [4.00000, 0.75000, 0.25649, 4.21270],
-                   [4.00000, 0.80000, 0.23868, 5.01740],
-                   [4.00000, 0.50000, 0.21000, 1.36326],
-                   [4.00000, 0.55000, 0.22200, 1.38783],
-                   [4.00000, 0.60000, 0.29689, 3.92797],
-                   [4.00000, 0.65000, 0.28355, 4.40932],
-                   [4.00000, 0.70000, 0.27274, 4.51406],
-                   [4.00000, 0.75000, 0.25911, 4.48876],
-                   [4.00000, 0.80000, 0.24156, 5.35514],
-                   [4.00000, 0.50000, 0.21500, 1.44153],
-                   [4.00000, 0.55000, 0.22800, 1.49839],
-                   [4.00000, 0.60000, 0.30660, 4.21447],
-                   [4.00000, 0.65000, 0.28601, 4.73889],
-                   [4.00000, 0.70000, 0.27464, 4.77340],
-                   [4.00000, 0.75000, 0.26187, 4.82025],
-                   [4.00000, 0.80000, 0.24358, 5.60992],
-                   [4.00000, 0.50000, 0.22000, 1.54314],
-                   [4.00000, 0.55000, 0.23401, 1.58695],
-                   [4.00000, 0.60000, 0.31760, 4.53070],
-                   [4.00000, 0.65000, 0.28820, 5.00125],
-                   [4.00000, 0.70000, 0.27738, 5.19625],
-                   [4.00000, 0.75000, 0.26409, 5.14887],
-                   [4.00000, 0.80000, 0.24490, 5.80758],
-                   [4.00000, 0.50000, 0.22501, 1.63883],
-                   [4.00000, 0.55000, 0.24001, 1.70776],
-                   [4.00000, 0.60000, 0.33063, 4.88296],
-                   [4.00000, 0.65000, 0.28954, 5.22881],
-                   [4.00000, 0.70000, 0.27953, 5.53011],
-                   [4.00000, 0.75000, 0.26595, 5.38634],
-                   [4.00000, 0.80000, 0.24696, 6.08172],
-                   [4.00000, 0.50000, 0.23000, 1.75048],
-                   [4.00000, 0.55000, 0.24601, 1.82613],
-                   [4.00000, 0.60000, 0.34152, 5.21369],
-                   [4.00000, 0.65000, 0.29145, 5.50100],
-                   [4.00000, 0.70000, 0.28145, 5.85055],
-                   [4.00000, 0.75000, 0.26727, 5.61151],
-                   [4.00000, 0.80000, 0.25222, 6.89292],
-                   [4.00000, 0.50000, 0.23500, 1.87364],
-                   [4.00000, 0.55000, 0.25200, 1.97525],
-                   [4.00000, 0.60000, 0.35065, 5.56901],
-                   [4.00000, 0.65000, 0.29433, 5.84811],
-                   [4.00000, 0.70000, 0.28312, 6.14249],
-                   [4.00000, 0.75000, 0.26918, 5.92464],
-                   [4.00000, 0.80000, 0.25440, 7.24579],
-                   [4.00000, 0.50000, 0.24000, 2.00641],
-                   [4.00000, 0.55000, 0.25800, 2.12533],
-                   [4.00000, 0.60000, 0.35822, 5.93809],
-                   [4.00000, 0.65000, 0.29813, 6.21580],
-                   [4.00000, 0.70000, 0.28489, 6.48299],
-                   [4.00000, 0.75000, 0.27130, 6.29206],
-                   [4.00000, 0.80000, 0.25546, 7.43550],
-                   [4.00000, 0.50000, 0.24499, 2.14776],
-                   [4.00000, 0.55000, 0.26400, 2.29425],
-                   [4.00000, 0.60000, 0.36740, 6.55647],
-                   [4.00000, 0.65000, 0.30903, 6.64607],
-                   [4.00000, 0.70000, 0.28686, 6.82872],
-                   [4.00000, 0.75000, 0.27417, 6.76315],
-                   [4.00000, 0.80000, 0.25791, 7.89417],
-                   [4.00000, 0.50000, 0.25000, 2.33604],
-                   [4.00000, 0.55000, 0.27000, 2.46134],
-                   [4.00000, 0.60000, 0.37070, 6.85493],
-                   [4.00000, 0.65000, 0.32618, 6.67977],
-                   [4.00000, 0.70000, 0.28865, 7.15599],
-                   [4.00000, 0.75000, 0.27768, 7.43676],
-                   [4.00000, 0.80000, 0.26090, 8.47604],
-                   [4.00000, 0.50000, 0.25500, 2.51497],
-                   [4.00000, 0.55000, 0.27600, 2.63026],
-                   [4.00000, 0.60000, 0.37341, 7.10744],
-                   [4.00000, 0.65000, 0.34336, 6.50185],
-                   [4.00000, 0.70000, 0.29096, 7.51796],
-                   [4.00000, 0.75000, 0.27983, 7.85422],
-                   [4.00000, 0.50000, 0.26000, 2.74915],
-                   [4.00000, 0.55000, 0.28199, 2.81178],
-                   [4.00000, 0.60000, 0.37649, 7.46114],
-                   [4.00000, 0.65000, 0.35980, 6.53648],
-                   [4.00000, 0.70000, 0.29327, 7.86101],
-                   [4.00000, 0.75000, 0.28153, 8.17972],
-                   [4.00000, 0.50000, 0.26500, 3.03294],
-                   [4.00000, 0.55000, 0.28800, 3.02132],
-                   [4.00000, 0.60000, 0.37935, 7.82441],
-                   [4.00000, 0.65000, 0.37069, 6.85750],
-                   [4.00000, 0.70000, 0.29527, 8.11884],
-                   [4.00000, 0.75000, 0.28394, 8.58868],
-                   [4.00000, 0.50000, 0.26984, 3.43679],
-                   [4.00000, 0.55000, 0.29399, 3.19029],
-                   [4.00000, 0.60000, 0.38179, 8.17943],
-                   [4.00000, 0.65000, 0.37518, 7.19121],
-                   [4.00000, 0.70000, 0.29948, 8.64324],
-                   [4.00000, 0.75000, 0.28614, 8.95836],
-                   [4.00000, 0.50000, 0.27516, 3.97140],
-                   [4.00000, 0.55000, 0.30000, 3.40929],
-                   [4.00000, 0.60000, 0.38441, 8.58389],
-                   [4.00000, 0.65000, 0.37941, 7.55508],
-                   [4.00000, 0.70000, 0.29695, 8.33452],
-                   [4.00000, 0.75000, 0.28809, 9.24767],
-                   [4.00000, 0.50000, 0.28000, 4.57789],
-                   [4.00000, 0.55000, 0.30600, 3.61302],
-                   [4.00000, 0.60000, 0.38650, 8.96145],
-                   [4.00000, 0.65000, 0.38207, 7.84793],
-                   [4.00000, 0.70000, 0.30196, 8.86980],
-                   [4.00000, 0.75000, 0.28998, 9.45861],
-                   [4.00000, 0.50000, 0.28500, 5.23053],
-                   [4.00000, 0.55000, 0.31200, 3.83099],
-                   [4.00000, 0.60000, 0.38793, 9.27127],
-                   [4.00000, 0.65000, 0.38507, 8.18930],
-                   [4.00000, 0.70000, 0.30442, 9.06724],
-                   [4.00000, 0.75000, 0.29166, 9.65139],
-                   [4.00000, 0.50000, 0.29000, 6.09894],
-                   [4.00000, 0.55000, 0.31839, 4.08388],
-                   [4.00000, 0.60000, 0.38907, 9.47786],
-                   [4.00000, 0.65000, 0.38756, 8.51580],
-                   [4.00000, 0.70000, 0.31333, 9.50655],
-                   [4.00000, 0.75000, 0.29335, 9.85169],
-                   [4.00000, 0.50000, 0.29500, 7.10644],
-                   [4.00000, 0.55000, 0.32400, 4.35071],
-                   [4.00000, 0.60000, 0.39002, 9.69338],
-                   [4.00000, 0.65000, 0.39001, 8.85918],
-                   [4.00000, 0.70000, 0.33048, 9.53523],
-                   [4.00000, 0.75000, 0.29564, 10.05953],
-                   [4.00000, 0.50000, 0.30000, 8.12686],
-                   [4.00000, 0.55000, 0.33000, 4.64698],
-                   [4.00000, 0.60000, 0.39095, 9.88737],
-                   [4.00000, 0.65000, 0.39213, 9.17709],
-                   [4.00000, 0.70000, 0.34454, 9.18238],
-                   [4.00000, 0.75000, 0.29767, 10.25814],
-                   [4.00000, 0.50000, 0.30484, 9.32292],
-                   [4.00000, 0.55000, 0.33600, 5.01081],
-                   [4.00000, 0.60000, 0.39178, 10.09712],
-                   [4.00000, 0.65000, 0.39420, 9.46155],
-                   [4.00000, 0.70000, 0.35475, 8.77146],
-                   [4.00000, 0.75000, 0.30030, 10.46261],
-                   [4.00000, 0.50000, 0.31016, 10.73391],
-                   [4.00000, 0.55000, 0.34161, 5.38360],
-                   [4.00000, 0.60000, 0.39250, 10.28245],
-                   [4.00000, 0.65000, 0.39580, 9.73771],
-                   [4.00000, 0.70000, 0.36909, 8.47194],
-                   [4.00000, 0.75000, 0.30313, 10.66484],
-                   [4.00000, 0.50000, 0.31476, 12.02574],
-                   [4.00000, 0.55000, 0.34722, 5.81498],
-                   [4.00000, 0.60000, 0.39312, 10.48354],
-                   [4.00000, 0.65000, 0.39769, 10.00846],
-                   [4.00000, 0.70000, 0.38280, 8.57285],
-                   [4.00000, 0.75000, 0.30669, 10.90437],
-                   [4.00000, 0.55000, 0.35400, 6.45311],
-                   [4.00000, 0.60000, 0.39394, 10.69365],
-                   [4.00000, 0.65000, 0.39915, 10.29556],
-                   [4.00000, 0.70000, 0.39146, 8.98317],
-                   [4.00000, 0.75000, 0.31812, 11.36272],
-                   [4.00000, 0.55000, 0.36000, 7.15820],
-                   [4.00000, 0.60000, 0.39533, 11.08331],
-                   [4.00000, 0.65000, 0.40073, 10.58887],
-                   [4.00000, 0.70000, 0.39514, 9.29034],
-                   [4.00000, 0.75000, 0.33332, 11.38969],
-                   [4.00000, 0.55000, 0.36600, 7.99110],
-                   [4.00000, 0.60000, 0.39588, 11.28654],
-                   [4.00000, 0.65000, 0.40239, 10.89179],
-                   [4.00000, 0.70000, 0.39816, 9.61561],
-                   [4.00000, 0.75000, 0.34355, 11.06542],
-                   [4.00000, 0.55000, 0.37200, 8.99580],
-                   [4.00000, 0.60000, 0.39831, 12.07153],
-                   [4.00000, 0.65000, 0.40355, 11.14342],
-                   [4.00000, 0.70000, 0.40020, 9.83436],
-                   [4.00000, 0.75000, 0.34814, 10.76882],
-                   [4.00000, 0.55000, 0.37800, 10.12420],
-                   [4.00000, 0.60000, 0.39696, 11.71166],
-                   [4.00000, 0.65000, 0.40540, 11.51344],
-                   [4.00000, 0.70000, 0.40234, 10.08902],
-                   [4.00000, 0.75000, 0.35195, 10.46498],
-                   [4.00000, 0.55000, 0.38439, 11.63433],
-                   [4.00000, 0.60000, 0.15027, 0.82584],
-                   [4.00000, 0.65000, 0.40697, 11.80817],
-                   [4.00000, 0.70000, 0.40365, 10.28847],
-                   [4.00000, 0.75000, 0.35509, 10.15092],
-                   [4.00000, 0.55000, 0.38595, 12.08432],
-                   [4.00000, 0.65000, 0.40832, 12.08974],
-                   [4.00000, 0.70000, 0.40502, 10.49332],
-                   [4.00000, 0.75000, 0.35894, 9.78428],
-                   [4.00000, 0.70000, 0.40701, 10.80715],
-                   [4.00000, 0.75000, 0.37003, 9.22807],
-                   [4.00000, 0.70000, 0.40858, 11.05749],
-                   [4.00000, 0.75000, 0.38492, 9.20969],
-                   [4.00000, 0.70000, 0.41071, 11.43570],
-                   [4.00000, 0.75000, 0.39629, 9.54026],
-                   [4.00000, 0.75000, 0.40281, 9.96859],
-                   [4.00000, 0.75000, 0.40559, 10.28315],
-                   [4.00000, 0.75000, 0.40759, 10.50185],
-                   [4.00000, 0.75000, 0.32573, 11.45510],
-                   [4.00000, 0.75000, 0.31246, 11.17694],
-                   [4.50000, 0.50000, 0.15417, 0.71088],
-                   [4.50000, 0.55000, 0.15862, 0.71709],
-                   [4.50000, 0.60000, 0.15614, 0.71856],
-                   [4.50000, 0.65000, 0.14999, 0.69793],
-                   [4.50000, 0.70000, 0.15068, 0.69751],
-                   [4.50000, 0.75000, 0.15032, 0.79868],
-                   [4.50000, 0.80000, 0.15062, 0.91141],
-                   [4.50000, 0.50000, 0.16284, 0.72908],
-                   [4.50000, 0.55000, 0.17594, 0.77515],
-                   [4.50000, 0.60000, 0.16934, 0.74779],
-                   [4.50000, 0.65000, 0.16934, 0.75442],
-                   [4.50000, 0.70000, 0.16925, 0.77988],
-                   [4.50000, 0.75000, 0.16936, 0.92614],
-                   [4.50000, 0.80000, 0.16940, 1.13175],
-                   [4.50000, 0.50000, 0.17171, 0.74728],
-                   [4.50000, 0.55000, 0.19325, 0.83205],
-                   [4.50000, 0.60000, 0.18254, 0.82495],
-                   [4.50000, 0.65000, 0.18254, 0.82152],
-                   [4.50000, 0.70000, 0.18255, 0.90550],
-                   [4.50000, 0.75000, 0.18258, 1.06324],
-                   [4.50000, 0.80000, 0.18262, 1.32004],
-                   [4.50000, 0.50000, 0.18059, 0.77630],
-                   [4.50000, 0.55000, 0.21064, 0.93791],
-                   [4.50000, 0.60000, 0.19574, 0.87954],
-                   [4.50000, 0.65000, 0.19575, 0.92616],
-                   [4.50000, 0.70000, 0.19577, 1.04022],
-                   [4.50000, 0.75000, 0.19580, 1.24140],
-                   [4.50000, 0.80000, 0.19586, 1.55452],
-                   [4.50000, 0.50000, 0.18946, 0.80891],
-                   [4.50000, 0.55000, 0.22790, 1.10956],
-                   [4.50000, 0.60000, 0.20904, 0.99867],
-                   [4.50000, 0.65000, 0.20897, 1.07596],
-                   [4.50000, 0.70000, 0.20908, 1.21758],
-                   [4.50000, 0.75000, 0.20897, 1.46254],
-                   [4.50000, 0.80000, 0.20917, 1.88174],
-                   [4.50000, 0.50000, 0.19833, 0.85321],
-                   [4.50000, 0.55000, 0.24593, 1.36746],
-                   [4.50000, 0.60000, 0.22281, 1.15369],
-                   [4.50000, 0.65000, 0.22208, 1.25451],
-                   [4.50000, 0.70000, 0.22222, 1.44625],
-                   [4.50000, 0.75000, 0.22228, 1.76600],
-                   [4.50000, 0.80000, 0.22009, 2.28590],
-                   [4.50000, 0.50000, 0.20720, 0.91484],
-                   [4.50000, 0.55000, 0.26326, 1.72955],
-                   [4.50000, 0.60000, 0.23540, 1.33797],
-                   [4.50000, 0.65000, 0.23550, 1.50467],
-                   [4.50000, 0.70000, 0.23542, 1.73768],
-                   [4.50000, 0.75000, 0.23503, 2.19936],
-                   [4.50000, 0.80000, 0.22805, 2.69149],
-                   [4.50000, 0.50000, 0.21617, 0.97920],
-                   [4.50000, 0.55000, 0.27955, 2.13649],
-                   [4.50000, 0.60000, 0.24906, 1.59685],
-                   [4.50000, 0.65000, 0.24935, 1.86069],
-                   [4.50000, 0.70000, 0.24732, 2.12247],
-                   [4.50000, 0.75000, 0.24507, 2.63563],
-                   [4.50000, 0.80000, 0.23461, 3.12770],
-                   [4.50000, 0.50000, 0.22497, 1.05879],
-                   [4.50000, 0.55000, 0.29356, 2.54031],
-                   [4.50000, 0.60000, 0.26189, 1.93397],
-                   [4.50000, 0.65000, 0.26043, 2.26641],
-                   [4.50000, 0.70000, 0.25680, 2.55951],
-                   [4.50000, 0.75000, 0.25310, 3.16404],
-                   [4.50000, 0.80000, 0.24009, 3.57079],
-                   [4.50000, 0.50000, 0.23385, 1.13980],
-                   [4.50000, 0.55000, 0.30661, 2.94444],
-                   [4.50000, 0.60000, 0.27457, 2.39705],
-                   [4.50000, 0.65000, 0.26934, 2.67864],
-                   [4.50000, 0.70000, 0.26455, 3.00118],
-                   [4.50000, 0.75000, 0.25848, 3.59879],
-                   [4.50000, 0.80000, 0.24493, 4.02745],
-                   [4.50000, 0.50000, 0.24294, 1.25232],
-                   [4.50000, 0.55000, 0.31792, 3.35705],
-                   [4.50000, 0.60000, 0.28518, 2.84737],
-                   [4.50000, 0.65000, 0.27803, 3.19049],
-                   [4.50000, 0.70000, 0.27089, 3.44307],
-                   [4.50000, 0.75000, 0.26310, 4.04231],
-                   [4.50000, 0.80000, 0.24900, 4.46423],
-                   [4.50000, 0.50000, 0.25248, 1.39482],
-                   [4.50000, 0.55000, 0.32601, 3.71608],
-                   [4.50000, 0.60000, 0.29650, 3.29362],
-                   [4.50000, 0.65000, 0.28422, 3.61613],
-                   [4.50000, 0.70000, 0.27614, 3.89965],
-                   [4.50000, 0.75000, 0.26685, 4.49321],
-                   [4.50000, 0.80000, 0.25241, 4.88269],
-                   [4.50000, 0.50000, 0.26112, 1.52692],
-                   [4.50000, 0.55000, 0.33487, 4.14140],
-                   [4.50000, 0.60000, 0.30868, 3.72379],
-                   [4.50000, 0.65000, 0.28884, 4.07688],
-                   [4.50000, 0.70000, 0.28000, 4.34039],
-                   [4.50000, 0.75000, 0.27006, 4.93718],
-                   [4.50000, 0.80000, 0.25596, 5.36393],
-                   [4.50000, 0.50000, 0.27021, 1.70060],
-                   [4.50000, 0.55000, 0.34181, 4.56457],
-                   [4.50000, 0.60000, 0.32187, 4.07353],
-                   [4.50000, 0.65000, 0.29292, 4.52032],
-                   [4.50000, 0.70000, 0.28344, 4.77790],
-                   [4.50000, 0.75000, 0.27316, 5.37488],
-                   [4.50000, 0.80000, 0.25994, 5.87498],
-                   [4.50000, 0.50000, 0.27912, 1.92515],
-                   [4.50000, 0.55000, 0.34661, 4.97065],
-                   [4.50000, 0.60000, 0.33538, 4.40411],
-                   [4.50000, 0.65000, 0.29721, 4.98323],
-                   [4.50000, 0.70000, 0.28664, 5.22884],
-                   [4.50000, 0.75000, 0.27594, 5.81920],
-                   [4.50000, 0.80000, 0.26326, 6.31877],
-                   [4.50000, 0.50000, 0.28600, 2.14415],
-                   [4.50000, 0.55000, 0.35149, 5.36743],
-                   [4.50000, 0.60000, 0.34774, 4.80721],
-                   [4.50000, 0.65000, 0.30270, 5.47029],
-                   [4.50000, 0.70000, 0.28981, 5.72569],
-                   [4.50000, 0.75000, 0.27883, 6.28109],
-                   [4.50000, 0.80000, 0.26658, 6.80620],
-                   [4.50000, 0.50000, 0.29114, 2.35961],
-                   [4.50000, 0.55000, 0.35503, 5.72462],
-                   [4.50000, 0.60000, 0.35692, 5.25699],
-                   [4.50000, 0.65000, 0.31251, 5.91260],
-                   [4.50000, 0.70000, 0.29188, 6.10656],
-                   [4.50000, 0.75000, 0.28183, 6.77218],
-                   [4.50000, 0.80000, 0.26990, 7.26459],
-                   [4.50000, 0.50000, 0.29573, 2.59014],
-                   [4.50000, 0.55000, 0.35858, 6.16218],
-                   [4.50000, 0.60000, 0.36412, 5.67699],
-                   [4.50000, 0.65000, 0.32573, 6.07712],
-                   [4.50000, 0.70000, 0.29432, 6.55463],
-                   [4.50000, 0.75000, 0.28450, 7.24232],
-                   [4.50000, 0.80000, 0.27324, 7.81461],
-                   [4.50000, 0.50000, 0.29988, 2.79841],
-                   [4.50000, 0.55000, 0.36189, 6.53506],
-                   [4.50000, 0.60000, 0.36971, 6.10961],
-                   [4.50000, 0.65000, 0.33892, 6.05024],
-                   [4.50000, 0.70000, 0.29711, 7.01102],
-                   [4.50000, 0.75000, 0.28728, 7.69060],
-                   [4.50000, 0.80000, 0.27638, 8.29753],
-                   [4.50000, 0.50000, 0.30348, 3.01686],
-                   [4.50000, 0.55000, 0.36513, 6.94281],
-                   [4.50000, 0.60000, 0.37271, 6.58871],
-                   [4.50000, 0.65000, 0.35211, 6.07024],
-                   [4.50000, 0.70000, 0.30043, 7.44344],
-                   [4.50000, 0.75000, 0.29027, 8.13426],
-                   [4.50000, 0.80000, 0.27993, 8.84862],
-                   [4.50000, 0.50000, 0.30687, 3.24804],
-                   [4.50000, 0.55000, 0.36821, 7.37591],
-                   [4.50000, 0.60000, 0.37864, 7.03197],
-                   [4.50000, 0.65000, 0.36534, 6.29065],
-                   [4.50000, 0.70000, 0.30451, 7.90665],
-                   [4.50000, 0.75000, 0.29359, 8.57802],
-                   [4.50000, 0.50000, 0.31025, 3.49442],
-                   [4.50000, 0.55000, 0.37069, 7.76991],
-                   [4.50000, 0.60000, 0.38153, 7.44041],
-                   [4.50000, 0.65000, 0.37515, 6.73870],
-                   [4.50000, 0.70000, 0.31053, 8.38075],
-                   [4.50000, 0.75000, 0.29707, 9.00634],
-                   [4.50000, 0.50000, 0.31288, 3.71330],
-                   [4.50000, 0.55000, 0.37382, 8.29209],
-                   [4.50000, 0.60000, 0.38462, 7.87902],
-                   [4.50000, 0.65000, 0.38145, 7.25324],
-                   [4.50000, 0.70000, 0.32097, 8.68743],
-                   [4.50000, 0.75000, 0.30228, 9.55551],
-                   [4.50000, 0.50000, 0.31541, 3.94650],
-                   [4.50000, 0.55000, 0.37628, 8.68052],
-                   [4.50000, 0.60000, 0.38753, 8.34542],
-                   [4.50000, 0.65000, 0.38576, 7.66815],
-                   [4.50000, 0.70000, 0.33416, 8.69486],
-                   [4.50000, 0.75000, 0.30680, 9.97256],
-                   [4.50000, 0.50000, 0.31814, 4.20971],
-                   [4.50000, 0.55000, 0.37773, 8.91617],
-                   [4.50000, 0.60000, 0.39052, 8.81201],
-                   [4.50000, 0.65000, 0.38941, 8.10104],
-                   [4.50000, 0.70000, 0.34733, 8.52758],
-                   [4.50000, 0.75000, 0.31490, 10.56961],
-                   [4.50000, 0.50000, 0.32003, 4.43700],
-                   [4.50000, 0.55000, 0.37908, 9.27277],
-                   [4.50000, 0.60000, 0.39285, 9.28799],
-                   [4.50000, 0.65000, 0.39253, 8.54919],
-                   [4.50000, 0.70000, 0.36048, 8.30040],
-                   [4.50000, 0.75000, 0.32674, 10.89944],
-                   [4.50000, 0.50000, 0.32210, 4.66496],
-                   [4.50000, 0.55000, 0.38131, 9.67878],
-                   [4.50000, 0.60000, 0.39475, 9.71584],
-                   [4.50000, 0.65000, 0.39635, 9.08164],
-                   [4.50000, 0.70000, 0.37365, 8.16600],
-                   [4.50000, 0.75000, 0.33827, 10.77820],
-                   [4.50000, 0.50000, 0.32348, 4.87343],
-                   [4.50000, 0.55000, 0.38325, 10.17008],
-                   [4.50000, 0.60000, 0.39714, 10.35188],
-                   [4.50000, 0.65000, 0.39891, 9.49278],
-                   [4.50000, 0.70000, 0.38688, 8.35969],
-                   [4.50000, 0.75000, 0.34794, 10.24585],
-                   [4.50000, 0.50000, 0.32552, 5.13906],
-                   [4.50000, 0.55000, 0.38514, 10.58938],
-                   [4.50000, 0.60000, 0.40007, 11.24821],
-                   [4.50000, 0.65000, 0.40160, 9.96135],
-                   [4.50000, 0.70000, 0.39616, 8.87282],
-                   [4.50000, 0.75000, 0.35439, 9.78065],
-                   [4.50000, 0.50000, 0.32763, 5.40721],
-                   [4.50000, 0.55000, 0.38618, 10.89108],
-                   [4.50000, 0.60000, 0.39843, 10.73736],
-                   [4.50000, 0.65000, 0.40388, 10.43971],
-                   [4.50000, 0.70000, 0.40086, 9.31174],
-                   [4.50000, 0.75000, 0.36224, 9.31057],
-                   [4.50000, 0.50000, 0.32881, 5.61447],
-                   [4.50000, 0.55000, 0.38743, 11.25174],
-                   [4.50000, 0.60000, 0.40233, 12.00932],
-                   [4.50000, 0.65000, 0.40623, 10.90241],
-                   [4.50000, 0.70000, 0.40418, 9.74126],
-                   [4.50000, 0.75000, 0.37415, 9.05166],
-                   [4.50000, 0.50000, 0.33046, 5.89217],
-                   [4.50000, 0.55000, 0.39052, 11.92633],
-                   [4.50000, 0.65000, 0.40833, 11.34409],
-                   [4.50000, 0.70000, 0.40676, 10.18405],
-                   [4.50000, 0.75000, 0.39181, 9.32141],
-                   [4.50000, 0.50000, 0.33205, 6.13281],
-                   [4.50000, 0.65000, 0.41077, 12.00315],
-                   [4.50000, 0.70000, 0.40932, 10.63462],
-                   [4.50000, 0.50000, 0.33348, 6.41424],
-                   [4.50000, 0.70000, 0.41120, 10.98529],
-                   [4.50000, 0.50000, 0.33488, 6.67048],
-                   [4.50000, 0.50000, 0.33697, 7.02070],
-                   [4.50000, 0.50000, 0.33942, 7.54629],
-                   [4.50000, 0.50000, 0.33822, 7.29462],
-                   [4.50000, 0.50000, 0.34086, 7.83031],
-                   [4.50000, 0.50000, 0.34193, 8.11830],
-                   [4.50000, 0.50000, 0.34250, 8.37772],
-                   [4.50000, 0.50000, 0.34399, 8.64536],
-                   [4.50000, 0.50000, 0.34550, 9.06182],
-                   [4.50000, 0.50000, 0.34467, 8.82626],
-                   [4.50000, 0.50000, 0.34661, 9.38932],
-                   [4.50000, 0.50000, 0.34761, 9.61399],
-                   [4.50000, 0.50000, 0.34943, 10.19021],
-                   [4.50000, 0.50000, 0.34843, 9.90148],
-                   [4.50000, 0.50000, 0.35073, 10.59085],
-                   [4.50000, 0.50000, 0.35167, 10.89219],
-                   [4.50000, 0.50000, 0.35264, 11.20321],
-                   [4.50000, 0.50000, 0.35361, 11.42724],
-                   [4.50000, 0.50000, 0.35448, 11.67821],
-                   [4.50000, 0.50000, 0.35543, 11.99863],
-                   [5.00000, 0.50000, 0.15081, 0.62800],
-                   [5.00000, 0.55000, 0.15022, 0.62548],
-                   [5.00000, 0.60000, 0.15061, 0.62945],
-                   [5.00000, 0.65000, 0.15061, 0.63137],
-                   [5.00000, 0.70000, 0.15022, 0.64456],
-                   [5.00000, 0.75000, 0.15002, 0.66835],
-                   [5.00000, 0.80000, 0.15023, 0.78924],
-                   [5.00000, 0.50000, 0.16926, 0.65483],
-                   [5.00000, 0.55000, 0.16926, 0.66340],
-                   [5.00000, 0.60000, 0.16926, 0.67503],
-                   [5.00000, 0.65000, 0.16926, 0.66653],
-                   [5.00000, 0.70000, 0.16926, 0.70573],
-                   [5.00000, 0.75000, 0.16926, 0.79113],
-                   [5.00000, 0.80000, 0.16927, 0.98063],
-                   [5.00000, 0.50000, 0.18241, 0.68208],
-                   [5.00000, 0.55000, 0.18241, 0.68762],
-                   [5.00000, 0.60000, 0.18176, 0.71243],
-                   [5.00000, 0.65000, 0.18241, 0.71903],
-                   [5.00000, 0.70000, 0.18241, 0.76997],
-                   [5.00000, 0.75000, 0.18242, 0.92028],
-                   [5.00000, 0.80000, 0.18243, 1.14457],
-                   [5.00000, 0.50000, 0.19556, 0.72426],
-                   [5.00000, 0.55000, 0.19556, 0.74573],
-                   [5.00000, 0.60000, 0.19663, 0.75655],
-                   [5.00000, 0.65000, 0.19557, 0.79801],
-                   [5.00000, 0.70000, 0.19557, 0.87299],
-                   [5.00000, 0.75000, 0.19558, 1.07708],
-                   [5.00000, 0.80000, 0.19559, 1.35996],
-                   [5.00000, 0.50000, 0.20872, 0.76019],
-                   [5.00000, 0.55000, 0.20872, 0.78762],
-                   [5.00000, 0.60000, 0.20958, 0.83517],
-                   [5.00000, 0.65000, 0.20872, 0.89208],
-                   [5.00000, 0.70000, 0.20873, 1.01079],
-                   [5.00000, 0.75000, 0.20874, 1.27378],
-                   [5.00000, 0.80000, 0.20875, 1.62827],
-                   [5.00000, 0.50000, 0.22187, 0.81697],
-                   [5.00000, 0.55000, 0.22187, 0.86815],
-                   [5.00000, 0.60000, 0.22044, 0.92866],
-                   [5.00000, 0.65000, 0.22188, 1.03203],
-                   [5.00000, 0.70000, 0.22189, 1.21568],
-                   [5.00000, 0.75000, 0.22191, 1.53084],
-                   [5.00000, 0.80000, 0.22160, 1.99077],
-                   [5.00000, 0.50000, 0.23502, 0.88332],
-                   [5.00000, 0.55000, 0.23448, 0.97003],
-                   [5.00000, 0.60000, 0.23595, 1.09047],
-                   [5.00000, 0.65000, 0.23504, 1.25014],
-                   [5.00000, 0.70000, 0.23505, 1.47872],
-                   [5.00000, 0.75000, 0.23464, 1.86801],
-                   [5.00000, 0.80000, 0.23192, 2.43334],
-                   [5.00000, 0.50000, 0.24829, 0.99301],
-                   [5.00000, 0.55000, 0.24819, 1.13109],
-                   [5.00000, 0.60000, 0.24906, 1.28927],
-                   [5.00000, 0.65000, 0.24821, 1.53803],
-                   [5.00000, 0.70000, 0.24725, 1.79542],
-                   [5.00000, 0.75000, 0.24624, 2.33410],
-                   [5.00000, 0.80000, 0.23953, 2.84415],
-                   [5.00000, 0.50000, 0.26134, 1.13584],
-                   [5.00000, 0.55000, 0.26135, 1.36418],
-                   [5.00000, 0.60000, 0.26222, 1.57299],
-                   [5.00000, 0.65000, 0.26127, 1.90859],
-                   [5.00000, 0.70000, 0.25860, 2.25627],
-                   [5.00000, 0.75000, 0.25450, 2.80427],
-                   [5.00000, 0.80000, 0.24721, 3.37514],
-                   [5.00000, 0.50000, 0.27450, 1.33022],
-                   [5.00000, 0.55000, 0.27451, 1.61790],
-                   [5.00000, 0.60000, 0.27485, 1.96153],
-                   [5.00000, 0.65000, 0.27196, 2.36392],
-                   [5.00000, 0.70000, 0.26761, 2.72560],
-                   [5.00000, 0.75000, 0.25996, 3.18544],
-                   [5.00000, 0.80000, 0.25260, 3.86964],
-                   [5.00000, 0.50000, 0.28666, 1.56860],
-                   [5.00000, 0.55000, 0.28768, 1.92300],
-                   [5.00000, 0.60000, 0.28544, 2.38079],
-                   [5.00000, 0.65000, 0.28101, 2.85660],
-                   [5.00000, 0.70000, 0.27350, 3.15572],
-                   [5.00000, 0.75000, 0.26540, 3.65427],
-                   [5.00000, 0.80000, 0.25695, 4.32434],
-                   [5.00000, 0.50000, 0.29910, 2.00541],
-                   [5.00000, 0.55000, 0.30085, 2.26005],
-                   [5.00000, 0.60000, 0.29613, 2.83951],
-                   [5.00000, 0.65000, 0.28686, 3.28729],
-                   [5.00000, 0.70000, 0.27924, 3.68094],
-                   [5.00000, 0.75000, 0.26904, 4.08314],
-                   [5.00000, 0.80000, 0.26079, 4.78535],
-                   [5.00000, 0.50000, 0.30862, 2.48079],
-                   [5.00000, 0.55000, 0.31402, 2.65985],
-                   [5.00000, 0.60000, 0.30888, 3.27713],
-                   [5.00000, 0.65000, 0.29194, 3.76224],
-                   [5.00000, 0.70000, 0.28383, 4.20283],
-                   [5.00000, 0.75000, 0.27318, 4.55769],
-                   [5.00000, 0.80000, 0.26463, 5.27122],
-                   [5.00000, 0.50000, 0.31554, 2.88556],
-                   [5.00000, 0.55000, 0.32570, 3.09090],
-                   [5.00000, 0.60000, 0.32204, 3.59559],
-                   [5.00000, 0.65000, 0.29637, 4.19331],
-                   [5.00000, 0.70000, 0.28765, 4.71658],
-                   [5.00000, 0.75000, 0.27683, 5.00991],
-                   [5.00000, 0.80000, 0.26801, 5.72393],
-                   [5.00000, 0.50000, 0.32203, 3.33144],
-                   [5.00000, 0.55000, 0.33515, 3.49993],
-                   [5.00000, 0.60000, 0.33435, 3.83644],
-                   [5.00000, 0.65000, 0.30180, 4.67258],
-                   [5.00000, 0.70000, 0.29163, 5.30735],
-                   [5.00000, 0.75000, 0.27949, 5.40538],
-                   [5.00000, 0.80000, 0.27053, 6.08503],
-                   [5.00000, 0.50000, 0.32638, 3.73810],
-                   [5.00000, 0.55000, 0.34272, 3.94586],
-                   [5.00000, 0.60000, 0.34654, 4.24585],
-                   [5.00000, 0.65000, 0.31107, 5.15453],
-                   [5.00000, 0.70000, 0.29496, 5.76891],
-                   [5.00000, 0.75000, 0.28284, 5.88422],
-                   [5.00000, 0.80000, 0.27368, 6.57773],
-                   [5.00000, 0.50000, 0.33070, 4.19010],
-                   [5.00000, 0.55000, 0.34826, 4.36600],
-                   [5.00000, 0.60000, 0.35540, 4.67723],
-                   [5.00000, 0.65000, 0.32315, 5.36533],
-                   [5.00000, 0.70000, 0.29993, 6.32468],
-                   [5.00000, 0.75000, 0.28603, 6.35152],
-                   [5.00000, 0.80000, 0.27690, 7.11472],
-                   [5.00000, 0.50000, 0.33428, 4.65284],
-                   [5.00000, 0.55000, 0.35302, 4.80832],
-                   [5.00000, 0.60000, 0.36265, 5.13129],
-                   [5.00000, 0.65000, 0.33571, 5.37415],
-                   [5.00000, 0.70000, 0.30397, 6.76676],
-                   [5.00000, 0.75000, 0.28891, 6.84042],
-                   [5.00000, 0.80000, 0.28033, 7.62694],
-                   [5.00000, 0.50000, 0.33742, 5.10217],
-                   [5.00000, 0.55000, 0.35714, 5.24199],
-                   [5.00000, 0.60000, 0.36828, 5.56953],
-                   [5.00000, 0.65000, 0.34887, 5.45488],
-                   [5.00000, 0.70000, 0.30970, 7.26826],
-                   [5.00000, 0.75000, 0.29157, 7.24397],
-                   [5.00000, 0.80000, 0.28353, 8.09947],
-                   [5.00000, 0.50000, 0.34044, 5.54280],
-                   [5.00000, 0.55000, 0.36072, 5.69212],
-                   [5.00000, 0.60000, 0.37281, 5.99464],
-                   [5.00000, 0.65000, 0.36128, 5.72447],
-                   [5.00000, 0.70000, 0.32054, 7.76257],
-                   [5.00000, 0.75000, 0.29491, 7.70236],
-                   [5.00000, 0.80000, 0.28671, 8.58092],
-                   [5.00000, 0.50000, 0.34323, 6.01471],
-                   [5.00000, 0.55000, 0.36439, 6.17018],
-                   [5.00000, 0.60000, 0.37750, 6.51944],
-                   [5.00000, 0.65000, 0.37114, 6.16796],
-                   [5.00000, 0.70000, 0.33390, 7.90999],
-                   [5.00000, 0.75000, 0.29788, 8.13617],
-                   [5.00000, 0.80000, 0.28982, 9.03659],
-                   [5.00000, 0.50000, 0.34527, 6.43382],
-                   [5.00000, 0.55000, 0.36725, 6.60475],
-                   [5.00000, 0.60000, 0.38085, 6.91201],
-                   [5.00000, 0.65000, 0.37827, 6.65946],
-                   [5.00000, 0.70000, 0.34705, 7.87260],
-                   [5.00000, 0.75000, 0.30146, 8.58064],
-                   [5.00000, 0.50000, 0.34706, 6.86495],
-                   [5.00000, 0.55000, 0.36975, 6.99614],
-                   [5.00000, 0.60000, 0.38406, 7.37488],
-                   [5.00000, 0.65000, 0.38270, 7.08674],
-                   [5.00000, 0.70000, 0.36019, 7.81611],
-                   [5.00000, 0.75000, 0.30547, 9.01589],
-                   [5.00000, 0.50000, 0.34907, 7.37083],
-                   [5.00000, 0.55000, 0.37243, 7.44746],
-                   [5.00000, 0.60000, 0.38650, 7.87547],
-                   [5.00000, 0.65000, 0.38805, 7.69970],
-                   [5.00000, 0.70000, 0.37335, 7.84236],
-                   [5.00000, 0.75000, 0.31015, 9.50112],
-                   [5.00000, 0.50000, 0.35114, 7.83991],
-                   [5.00000, 0.55000, 0.37504, 7.93523],
-                   [5.00000, 0.60000, 0.38949, 8.38522],
-                   [5.00000, 0.65000, 0.39242, 8.26359],
-                   [5.00000, 0.70000, 0.38651, 8.07327],
-                   [5.00000, 0.75000, 0.31949, 9.92327],
-                   [5.00000, 0.50000, 0.35279, 8.33446],
-                   [5.00000, 0.55000, 0.37734, 8.36052],
-                   [5.00000, 0.60000, 0.39153, 8.74243],
-                   [5.00000, 0.65000, 0.39577, 8.73568],
-                   [5.00000, 0.70000, 0.39628, 8.55920],
-                   [5.00000, 0.75000, 0.33269, 9.99974],
-                   [5.00000, 0.50000, 0.35405, 8.78064],
-                   [5.00000, 0.55000, 0.38015, 8.83138],
-                   [5.00000, 0.60000, 0.39390, 9.22665],
-                   [5.00000, 0.65000, 0.39852, 9.11707],
-                   [5.00000, 0.70000, 0.40008, 8.92316],
-                   [5.00000, 0.75000, 0.34488, 9.65205],
-                   [5.00000, 0.50000, 0.35670, 9.86749],
-                   [5.00000, 0.55000, 0.38245, 9.26020],
-                   [5.00000, 0.60000, 0.39615, 9.64863],
-                   [5.00000, 0.65000, 0.40185, 9.75238],
-                   [5.00000, 0.70000, 0.40398, 9.40785],
-                   [5.00000, 0.75000, 0.35492, 9.16806],
-                   [5.00000, 0.50000, 0.35509, 9.15922],
-                   [5.00000, 0.55000, 0.38463, 9.72145],
-                   [5.00000, 0.60000, 0.39947, 10.44791],
-                   [5.00000, 0.65000, 0.40543, 10.41664],
-                   [5.00000, 0.70000, 0.41034, 10.48574],
-                   [5.00000, 0.75000, 0.36441, 8.79607],
-                   [5.00000, 0.50000, 0.35894, 10.68475],
-                   [5.00000, 0.55000, 0.38659, 10.17281],
-                   [5.00000, 0.60000, 0.39729, 9.91906],
-                   [5.00000, 0.65000, 0.40842, 10.92894],
-                   [5.00000, 0.70000, 0.40656, 9.81618],
-                   [5.00000, 0.75000, 0.37835, 8.67233],
-                   [5.00000, 0.50000, 0.36035, 11.18903],
-                   [5.00000, 0.55000, 0.38856, 10.61890],
-                   [5.00000, 0.60000, 0.40222, 11.06988],
-                   [5.00000, 0.65000, 0.41109, 11.47752],
-                   [5.00000, 0.70000, 0.41419, 11.10215],
-                   [5.00000, 0.75000, 0.39134, 8.97150],
-                   [5.00000, 0.50000, 0.36160, 11.96994],
-                   [5.00000, 0.55000, 0.39034, 11.07941],
-                   [5.00000, 0.60000, 0.40376, 11.52323],
-                   [5.00000, 0.65000, 0.41305, 11.98011],
-                   [5.00000, 0.70000, 0.41692, 11.57820],
-                   [5.00000, 0.75000, 0.40145, 9.43848],
-                   [5.00000, 0.55000, 0.39216, 11.55196],
-                   [5.00000, 0.60000, 0.40540, 11.99306],
-                   [5.00000, 0.70000, 0.41929, 11.97507],
-                   [5.00000, 0.75000, 0.40713, 9.83653],
-                   [5.00000, 0.55000, 0.39390, 11.99704],
-                   [5.00000, 0.75000, 0.41116, 10.27757],
-                   [5.00000, 0.75000, 0.41563, 10.93894],
-                   [5.50000, 0.50000, 0.14993, 0.52027],
-                   [5.50000, 0.55000, 0.15030, 0.52002],
-                   [5.50000, 0.60000, 0.15029, 0.58846],
-                   [5.50000, 0.65000, 0.14989, 0.51160],
-                   [5.50000, 0.70000, 0.15010, 0.53589],
-                   [5.50000, 0.75000, 0.15010, 0.58382],
-                   [5.50000, 0.80000, 0.15052, 0.66848],
-                   [5.50000, 0.50000, 0.16947, 0.53128],
-                   [5.50000, 0.55000, 0.16925, 0.52847],
-                   [5.50000, 0.60000, 0.16925, 0.56046],
-                   [5.50000, 0.65000, 0.17099, 0.56501],
-                   [5.50000, 0.70000, 0.16925, 0.57015],
-                   [5.50000, 0.75000, 0.16923, 0.69232],
-                   [5.50000, 0.80000, 0.16965, 0.81427],
-                   [5.50000, 0.50000, 0.18274, 0.54012],
-                   [5.50000, 0.55000, 0.18252, 0.54188],
-                   [5.50000, 0.60000, 0.18251, 0.57985],
-                   [5.50000, 0.65000, 0.18425, 0.60793],
-                   [5.50000, 0.70000, 0.18251, 0.63319],
-                   [5.50000, 0.75000, 0.18249, 0.79520],
-                   [5.50000, 0.80000, 0.18290, 0.98357],
-                   [5.50000, 0.50000, 0.19600, 0.56244],
-                   [5.50000, 0.55000, 0.19578, 0.56880],
-                   [5.50000, 0.60000, 0.19578, 0.60708],
-                   [5.50000, 0.65000, 0.19751, 0.66507],
-                   [5.50000, 0.70000, 0.19576, 0.72754],
-                   [5.50000, 0.75000, 0.19574, 0.93161],
-                   [5.50000, 0.80000, 0.19612, 1.17676],
-                   [5.50000, 0.50000, 0.20927, 0.59390],
-                   [5.50000, 0.55000, 0.20905, 0.59957],
-                   [5.50000, 0.60000, 0.20904, 0.65996],
-                   [5.50000, 0.65000, 0.21077, 0.74218],
-                   [5.50000, 0.70000, 0.20902, 0.84483],
-                   [5.50000, 0.75000, 0.20898, 1.09763],
-                   [5.50000, 0.80000, 0.20938, 1.41932],
-                   [5.50000, 0.50000, 0.22253, 0.63308],
-                   [5.50000, 0.55000, 0.22231, 0.66131],
-                   [5.50000, 0.60000, 0.22230, 0.74169],
-                   [5.50000, 0.65000, 0.22402, 0.86008],
-                   [5.50000, 0.70000, 0.22226, 1.00986],
-                   [5.50000, 0.75000, 0.22223, 1.30629],
-                   [5.50000, 0.80000, 0.22260, 1.74750],
-                   [5.50000, 0.50000, 0.23579, 0.68088],
-                   [5.50000, 0.55000, 0.23557, 0.74427],
-                   [5.50000, 0.60000, 0.23555, 0.87218],
-                   [5.50000, 0.65000, 0.23727, 1.03168],
-                   [5.50000, 0.70000, 0.23551, 1.22356],
-                   [5.50000, 0.75000, 0.23546, 1.59490],
-                   [5.50000, 0.80000, 0.23484, 2.18599],
-                   [5.50000, 0.50000, 0.24905, 0.75176],
-                   [5.50000, 0.55000, 0.24882, 0.87217],
-                   [5.50000, 0.60000, 0.24880, 1.03172],
-                   [5.50000, 0.65000, 0.25051, 1.29322],
-                   [5.50000, 0.70000, 0.24874, 1.51746],
-                   [5.50000, 0.75000, 0.24791, 2.00573],
-                   [5.50000, 0.80000, 0.24456, 2.64677],
-                   [5.50000, 0.50000, 0.26231, 0.84394],
-                   [5.50000, 0.55000, 0.26207, 1.02821],
-                   [5.50000, 0.60000, 0.26204, 1.28201],
-                   [5.50000, 0.65000, 0.26373, 1.65432],
-                   [5.50000, 0.70000, 0.26134, 1.94429],
-                   [5.50000, 0.75000, 0.25781, 2.45394],
-                   [5.50000, 0.80000, 0.25201, 3.08771],
-                   [5.50000, 0.50000, 0.27562, 0.95720],
-                   [5.50000, 0.55000, 0.27531, 1.24022],
-                   [5.50000, 0.60000, 0.27643, 1.64455],
-                   [5.50000, 0.65000, 0.27455, 2.05108],
-                   [5.50000, 0.70000, 0.27055, 2.41139],
-                   [5.50000, 0.75000, 0.26494, 2.89201],
-                   [5.50000, 0.80000, 0.25815, 3.53166],
-                   [5.50000, 0.50000, 0.28881, 1.14815],
-                   [5.50000, 0.55000, 0.28855, 1.48132],
-                   [5.50000, 0.60000, 0.28815, 2.01919],
-                   [5.50000, 0.65000, 0.28320, 2.46514],
-                   [5.50000, 0.70000, 0.27748, 2.86742],
-                   [5.50000, 0.75000, 0.27066, 3.34469],
-                   [5.50000, 0.80000, 0.26378, 4.00803],
-                   [5.50000, 0.50000, 0.30171, 1.44690],
-                   [5.50000, 0.55000, 0.30178, 1.76072],
-                   [5.50000, 0.60000, 0.30103, 2.50787],
-                   [5.50000, 0.65000, 0.29096, 2.94163],
-                   [5.50000, 0.70000, 0.28311, 3.32390],
-                   [5.50000, 0.75000, 0.27517, 3.80847],
-                   [5.50000, 0.80000, 0.26752, 4.43267],
-                   [5.50000, 0.50000, 0.31375, 1.91498],
-                   [5.50000, 0.55000, 0.31501, 2.09111],
-                   [5.50000, 0.60000, 0.31425, 2.87425],
-                   [5.50000, 0.65000, 0.29743, 3.39128],
-                   [5.50000, 0.70000, 0.28821, 3.82727],
-                   [5.50000, 0.75000, 0.27853, 4.21672],
-                   [5.50000, 0.80000, 0.27117, 4.86794],
-                   [5.50000, 0.50000, 0.32289, 2.36131],
-                   [5.50000, 0.55000, 0.32638, 2.46675],
-                   [5.50000, 0.60000, 0.32749, 3.09125],
-                   [5.50000, 0.65000, 0.30423, 3.85554],
-                   [5.50000, 0.70000, 0.29242, 4.27621],
-                   [5.50000, 0.75000, 0.28189, 4.66516],
-                   [5.50000, 0.80000, 0.27490, 5.41681],
-                   [5.50000, 0.50000, 0.32960, 2.79067],
-                   [5.50000, 0.55000, 0.33579, 2.85131],
-                   [5.50000, 0.60000, 0.34073, 3.32313],
-                   [5.50000, 0.65000, 0.31450, 4.29486],
-                   [5.50000, 0.70000, 0.29632, 4.77863],
-                   [5.50000, 0.75000, 0.28490, 5.16596],
-                   [5.50000, 0.80000, 0.27924, 6.08593],
-                   [5.50000, 0.50000, 0.33533, 3.22260],
-                   [5.50000, 0.55000, 0.34426, 3.24749],
-                   [5.50000, 0.60000, 0.35221, 3.69550],
-                   [5.50000, 0.65000, 0.32778, 4.53846],
-                   [5.50000, 0.70000, 0.29976, 5.22053],
-                   [5.50000, 0.75000, 0.28775, 5.60422],
-                   [5.50000, 0.80000, 0.28213, 6.50487],
-                   [5.50000, 0.50000, 0.34035, 3.71155],
-                   [5.50000, 0.55000, 0.35229, 3.75180],
-                   [5.50000, 0.60000, 0.36094, 4.12423],
-                   [5.50000, 0.65000, 0.34100, 4.59301],
-                   [5.50000, 0.70000, 0.30395, 5.66688],
-                   [5.50000, 0.75000, 0.29088, 6.07318],
-                   [5.50000, 0.80000, 0.28524, 6.97964],
-                   [5.50000, 0.50000, 0.34406, 4.12807],
-                   [5.50000, 0.55000, 0.35802, 4.20901],
-                   [5.50000, 0.60000, 0.36772, 4.55803],
-                   [5.50000, 0.65000, 0.35425, 4.72610],
-                   [5.50000, 0.70000, 0.30915, 6.13405],
-                   [5.50000, 0.75000, 0.29507, 6.58612],
-                   [5.50000, 0.80000, 0.28870, 7.51178],
-                   [5.50000, 0.50000, 0.34769, 4.65595],
-                   [5.50000, 0.55000, 0.36314, 4.65274],
-                   [5.50000, 0.60000, 0.37338, 5.00556],
-                   [5.50000, 0.65000, 0.36541, 5.08538],
-                   [5.50000, 0.70000, 0.31779, 6.57486],
-                   [5.50000, 0.75000, 0.29897, 7.05777],
-                   [5.50000, 0.80000, 0.29173, 7.92505],
-                   [5.50000, 0.50000, 0.35048, 5.11217],
-                   [5.50000, 0.55000, 0.36743, 5.11668],
-                   [5.50000, 0.60000, 0.37771, 5.45314],
-                   [5.50000, 0.65000, 0.37361, 5.53605],
-                   [5.50000, 0.70000, 0.33005, 6.84107],
-                   [5.50000, 0.75000, 0.30260, 7.47893],
-                   [5.50000, 0.80000, 0.29544, 8.41606],
-                   [5.50000, 0.50000, 0.35291, 5.53243],
-                   [5.50000, 0.55000, 0.37082, 5.52074],
-                   [5.50000, 0.60000, 0.38218, 5.91495],
-                   [5.50000, 0.65000, 0.37995, 5.96035],
-                   [5.50000, 0.70000, 0.34331, 6.87736],
-                   [5.50000, 0.75000, 0.30771, 7.97404],
-                   [5.50000, 0.80000, 0.29744, 8.70607],
-                   [5.50000, 0.50000, 0.35531, 5.99959],
-                   [5.50000, 0.55000, 0.37407, 5.96156],
-                   [5.50000, 0.60000, 0.38599, 6.34231],
-                   [5.50000, 0.65000, 0.38547, 6.44686],
-                   [5.50000, 0.70000, 0.35658, 6.87179],
-                   [5.50000, 0.75000, 0.31215, 8.32753],
-                   [5.50000, 0.50000, 0.35801, 6.56465],
-                   [5.50000, 0.55000, 0.37698, 6.41454],
-                   [5.50000, 0.60000, 0.38868, 6.72864],
-                   [5.50000, 0.65000, 0.39025, 6.89999],
-                   [5.50000, 0.70000, 0.36978, 6.99868],
-                   [5.50000, 0.75000, 0.32148, 8.71884],
-                   [5.50000, 0.50000, 0.36065, 7.11969],
-                   [5.50000, 0.55000, 0.37999, 6.85354],
-                   [5.50000, 0.60000, 0.39273, 7.20242],
-                   [5.50000, 0.65000, 0.39391, 7.41782],
-                   [5.50000, 0.70000, 0.38273, 7.32451],
-                   [5.50000, 0.75000, 0.33429, 8.76569],
-                   [5.50000, 0.50000, 0.36288, 7.66286],
-                   [5.50000, 0.55000, 0.38240, 7.29531],
-                   [5.50000, 0.60000, 0.39576, 7.66823],
-                   [5.50000, 0.65000, 0.39723, 7.86773],
-                   [5.50000, 0.70000, 0.39333, 7.78213],
-                   [5.50000, 0.75000, 0.34783, 8.50216],
-                   [5.50000, 0.50000, 0.36497, 8.24371],
-                   [5.50000, 0.55000, 0.38537, 7.81775],
-                   [5.50000, 0.60000, 0.39834, 8.09497],
-                   [5.50000, 0.65000, 0.40076, 8.34301],
-                   [5.50000, 0.70000, 0.40043, 8.24338],
-                   [5.50000, 0.75000, 0.36117, 8.08589],
-                   [5.50000, 0.50000, 0.36714, 8.90158],
-                   [5.50000, 0.55000, 0.39166, 9.18307],
-                   [5.50000, 0.60000, 0.40030, 8.54886],
-                   [5.50000, 0.65000, 0.40477, 8.79770],
-                   [5.50000, 0.70000, 0.40487, 8.73824],
-                   [5.50000, 0.75000, 0.37604, 7.90815],
-                   [5.50000, 0.50000, 0.36883, 9.56044],
-                   [5.50000, 0.55000, 0.38757, 8.25913],
-                   [5.50000, 0.60000, 0.40361, 9.17132],
-                   [5.50000, 0.65000, 0.40836, 9.32943],
-                   [5.50000, 0.70000, 0.40933, 9.21387],
-                   [5.50000, 0.75000, 0.38880, 8.16780],
-                   [5.50000, 0.50000, 0.37031, 10.16008],
-                   [5.50000, 0.55000, 0.38925, 8.63157],
-                   [5.50000, 0.60000, 0.40632, 9.73801],
-                   [5.50000, 0.65000, 0.41161, 9.80435],
-                   [5.50000, 0.70000, 0.41317, 9.68049],
-                   [5.50000, 0.75000, 0.39913, 8.66115],
-                   [5.50000, 0.50000, 0.37169, 10.72381],
-                   [5.50000, 0.55000, 0.39475, 9.88528],
-                   [5.50000, 0.60000, 0.40872, 10.28067],
-                   [5.50000, 0.65000, 0.41432, 10.26925],
-                   [5.50000, 0.70000, 0.41617, 10.12418],
-                   [5.50000, 0.75000, 0.40566, 9.15857],
-                   [5.50000, 0.50000, 0.37386, 11.96917],
-                   [5.50000, 0.55000, 0.39647, 10.35765],
-                   [5.50000, 0.60000, 0.41049, 10.72927],
-                   [5.50000, 0.65000, 0.41756, 10.75287],
-                   [5.50000, 0.70000, 0.41939, 10.58852],
-                   [5.50000, 0.75000, 0.41147, 9.65592],
-                   [5.50000, 0.50000, 0.37284, 11.29306],
-                   [5.50000, 0.55000, 0.39808, 10.84455],
-                   [5.50000, 0.60000, 0.41565, 11.96955],
-                   [5.50000, 0.65000, 0.42003, 11.17738],
-                   [5.50000, 0.70000, 0.42236, 11.03264],
-                   [5.50000, 0.75000, 0.41381, 9.87379],
-                   [5.50000, 0.55000, 0.39979, 11.30908],
-                   [5.50000, 0.60000, 0.41374, 11.43285],
-                   [5.50000, 0.65000, 0.42455, 11.96300],
-                   [5.50000, 0.70000, 0.42513, 11.46077],
-                   [5.50000, 0.55000, 0.40158, 11.94916],
-                   [5.50000, 0.70000, 0.42807, 11.96365],
-                   [6.00000, 0.50000, 0.15020, 0.44724],
-                   [6.00000, 0.55000, 0.15020, 0.45616],
-                   [6.00000, 0.60000, 0.15046, 0.45364],
-                   [6.00000, 0.65000, 0.15043, 0.45442],
-                   [6.00000, 0.70000, 0.15020, 0.45759],
-                   [6.00000, 0.75000, 0.15019, 0.50445],
-                   [6.00000, 0.80000, 0.15039, 0.57845],
-                   [6.00000, 0.50000, 0.16921, 0.46734],
-                   [6.00000, 0.55000, 0.16917, 0.46941],
-                   [6.00000, 0.60000, 0.17007, 0.47261],
-                   [6.00000, 0.65000, 0.16964, 0.47908],
-                   [6.00000, 0.70000, 0.16921, 0.49182],
-                   [6.00000, 0.75000, 0.16920, 0.59541],
-                   [6.00000, 0.80000, 0.16920, 0.74558],
-                   [6.00000, 0.50000, 0.18229, 0.48933],
-                   [6.00000, 0.55000, 0.18229, 0.48263],
-                   [6.00000, 0.60000, 0.18315, 0.49044],
-                   [6.00000, 0.65000, 0.18272, 0.49825],
-                   [6.00000, 0.70000, 0.18229, 0.54620],
-                   [6.00000, 0.75000, 0.18229, 0.68863],
-                   [6.00000, 0.80000, 0.18228, 0.90190],
-                   [6.00000, 0.50000, 0.19538, 0.50629],
-                   [6.00000, 0.55000, 0.19538, 0.51057],
-                   [6.00000, 0.60000, 0.19623, 0.51505],
-                   [6.00000, 0.65000, 0.19580, 0.54955],
-                   [6.00000, 0.70000, 0.19537, 0.62309],
-                   [6.00000, 0.75000, 0.19537, 0.81245],
-                   [6.00000, 0.80000, 0.19536, 1.09607],
-                   [6.00000, 0.50000, 0.20846, 0.52395],
-                   [6.00000, 0.55000, 0.20846, 0.53498],
-                   [6.00000, 0.60000, 0.20932, 0.56849],
-                   [6.00000, 0.65000, 0.20888, 0.62263],
-                   [6.00000, 0.70000, 0.20845, 0.73251],
-                   [6.00000, 0.75000, 0.20844, 0.97276],
-                   [6.00000, 0.80000, 0.20843, 1.34402],
-                   [6.00000, 0.50000, 0.22154, 0.55272],
-                   [6.00000, 0.55000, 0.22154, 0.55626],
-                   [6.00000, 0.60000, 0.22240, 0.63306],
-                   [6.00000, 0.65000, 0.22197, 0.71461],
-                   [6.00000, 0.70000, 0.22153, 0.87767],
-                   [6.00000, 0.75000, 0.22152, 1.18324],
-                   [6.00000, 0.80000, 0.22151, 1.65853],
-                   [6.00000, 0.50000, 0.23462, 0.59222],
-                   [6.00000, 0.55000, 0.23462, 0.63642],
-                   [6.00000, 0.60000, 0.23548, 0.71569],
-                   [6.00000, 0.65000, 0.23505, 0.85807],
-                   [6.00000, 0.70000, 0.23461, 1.06733],
-                   [6.00000, 0.75000, 0.23460, 1.44858],
-                   [6.00000, 0.80000, 0.23458, 2.07466],
-                   [6.00000, 0.50000, 0.24771, 0.64539],
-                   [6.00000, 0.55000, 0.24770, 0.72531],
-                   [6.00000, 0.60000, 0.24856, 0.86895],
-                   [6.00000, 0.65000, 0.24812, 1.05996],
-                   [6.00000, 0.70000, 0.24768, 1.32302],
-                   [6.00000, 0.75000, 0.24767, 1.82701],
-                   [6.00000, 0.80000, 0.24561, 2.52121],
-                   [6.00000, 0.50000, 0.26079, 0.71961],
-                   [6.00000, 0.55000, 0.26078, 0.86867],
-                   [6.00000, 0.60000, 0.26163, 1.10207],
-                   [6.00000, 0.65000, 0.26120, 1.34798],
-                   [6.00000, 0.70000, 0.26036, 1.70645],
-                   [6.00000, 0.75000, 0.25858, 2.27111],
-                   [6.00000, 0.80000, 0.25374, 2.93644],
-                   [6.00000, 0.50000, 0.27387, 0.80315],
-                   [6.00000, 0.55000, 0.27386, 1.06028],
-                   [6.00000, 0.60000, 0.27471, 1.38881],
-                   [6.00000, 0.65000, 0.27309, 1.72532],
-                   [6.00000, 0.70000, 0.27075, 2.15699],
-                   [6.00000, 0.75000, 0.26618, 2.70490],
-                   [6.00000, 0.80000, 0.26038, 3.36117],
-                   [6.00000, 0.50000, 0.28695, 0.93856],
-                   [6.00000, 0.55000, 0.28694, 1.27061],
-                   [6.00000, 0.60000, 0.28743, 1.73701],
-                   [6.00000, 0.65000, 0.28283, 2.17220],
-                   [6.00000, 0.70000, 0.27848, 2.61229],
-                   [6.00000, 0.75000, 0.27258, 3.13863],
-                   [6.00000, 0.80000, 0.26614, 3.84360],
-                   [6.00000, 0.50000, 0.30003, 1.15833],
-                   [6.00000, 0.55000, 0.30002, 1.49479],
-                   [6.00000, 0.60000, 0.30085, 2.13553],
-                   [6.00000, 0.65000, 0.29108, 2.63543],
-                   [6.00000, 0.70000, 0.28456, 3.04103],
-                   [6.00000, 0.75000, 0.27741, 3.57084],
-                   [6.00000, 0.80000, 0.27067, 4.28833],
-                   [6.00000, 0.50000, 0.31310, 1.49383],
-                   [6.00000, 0.55000, 0.31309, 1.75602],
-                   [6.00000, 0.60000, 0.31393, 2.44105],
-                   [6.00000, 0.65000, 0.29889, 3.06161],
-                   [6.00000, 0.70000, 0.28955, 3.46488],
-                   [6.00000, 0.75000, 0.28199, 4.01852],
-                   [6.00000, 0.80000, 0.27415, 4.71697],
-                   [6.00000, 0.50000, 0.32456, 1.94239],
-                   [6.00000, 0.55000, 0.32616, 2.05612],
-                   [6.00000, 0.60000, 0.32700, 2.60353],
-                   [6.00000, 0.65000, 0.30885, 3.53021],
-                   [6.00000, 0.70000, 0.29498, 3.94266],
-                   [6.00000, 0.75000, 0.28585, 4.45620],
-                   [6.00000, 0.80000, 0.27736, 5.16167],
-                   [6.00000, 0.50000, 0.33253, 2.35731],
-                   [6.00000, 0.55000, 0.33891, 2.43407],
-                   [6.00000, 0.60000, 0.34008, 2.75691],
-                   [6.00000, 0.65000, 0.32139, 3.79877],
-                   [6.00000, 0.70000, 0.30010, 4.37501],
-                   [6.00000, 0.75000, 0.28952, 4.92822],
-                   [6.00000, 0.80000, 0.28028, 5.55070],
-                   [6.00000, 0.50000, 0.33915, 2.80130],
-                   [6.00000, 0.55000, 0.34941, 2.88567],
-                   [6.00000, 0.60000, 0.35198, 3.07359],
-                   [6.00000, 0.65000, 0.33447, 3.90091],
-                   [6.00000, 0.70000, 0.30461, 4.81258],
-                   [6.00000, 0.75000, 0.29273, 5.39524],
-                   [6.00000, 0.80000, 0.28295, 5.97847],
-                   [6.00000, 0.50000, 0.34479, 3.25607],
-                   [6.00000, 0.55000, 0.35701, 3.32708],
-                   [6.00000, 0.60000, 0.36173, 3.50478],
-                   [6.00000, 0.65000, 0.34755, 4.01438],
-                   [6.00000, 0.70000, 0.31008, 5.28676],
-                   [6.00000, 0.75000, 0.29660, 5.90873],
-                   [6.00000, 0.80000, 0.28623, 6.51281],
-                   [6.00000, 0.50000, 0.34938, 3.70349],
-                   [6.00000, 0.55000, 0.36279, 3.78498],
-                   [6.00000, 0.60000, 0.36963, 3.99428],
-                   [6.00000, 0.65000, 0.36062, 4.29162],
-                   [6.00000, 0.70000, 0.32004, 5.70129],
-                   [6.00000, 0.75000, 0.30048, 6.35819],
-                   [6.00000, 0.80000, 0.28935, 6.98456],
-                   [6.00000, 0.50000, 0.35344, 4.13059],
-                   [6.00000, 0.55000, 0.36738, 4.21612],
-                   [6.00000, 0.60000, 0.37606, 4.40762],
-                   [6.00000, 0.65000, 0.37236, 4.73599],
-                   [6.00000, 0.70000, 0.33312, 5.86102],
-                   [6.00000, 0.75000, 0.30488, 6.78871],
-                   [6.00000, 0.80000, 0.29228, 7.48061],
-                   [6.00000, 0.50000, 0.35695, 4.58934],
-                   [6.00000, 0.55000, 0.37257, 4.68956],
-                   [6.00000, 0.60000, 0.38173, 4.92760],
-                   [6.00000, 0.65000, 0.37990, 5.16230],
-                   [6.00000, 0.70000, 0.34620, 5.86394],
-                   [6.00000, 0.75000, 0.31196, 7.29293],
-                   [6.00000, 0.80000, 0.29499, 7.93211],
-                   [6.00000, 0.50000, 0.36079, 5.13362],
-                   [6.00000, 0.55000, 0.37656, 5.13630],
-                   [6.00000, 0.60000, 0.38576, 5.30693],
-                   [6.00000, 0.65000, 0.38643, 5.64002],
-                   [6.00000, 0.70000, 0.35928, 5.90507],
-                   [6.00000, 0.75000, 0.32347, 7.59786],
-                   [6.00000, 0.50000, 0.36390, 5.64468],
-                   [6.00000, 0.55000, 0.38030, 5.57100],
-                   [6.00000, 0.60000, 0.39022, 5.77645],
-                   [6.00000, 0.65000, 0.39159, 6.07031],
-                   [6.00000, 0.70000, 0.37236, 6.12703],
-                   [6.00000, 0.75000, 0.33641, 7.58254],
-                   [6.00000, 0.50000, 0.36675, 6.11405],
-                   [6.00000, 0.55000, 0.38393, 6.00494],
-                   [6.00000, 0.60000, 0.39379, 6.22353],
-                   [6.00000, 0.65000, 0.39657, 6.51916],
-                   [6.00000, 0.70000, 0.38393, 6.53369],
-                   [6.00000, 0.75000, 0.35049, 7.34823],
-                   [6.00000, 0.50000, 0.36968, 6.60910],
-                   [6.00000, 0.55000, 0.38750, 6.50993],
-                   [6.00000, 0.60000, 0.39828, 6.70819],
-                   [6.00000, 0.65000, 0.40133, 6.96836],
-                   [6.00000, 0.70000, 0.39217, 6.97773],
-                   [6.00000, 0.75000, 0.36240, 7.10267],
-                   [6.00000, 0.50000, 0.37211, 7.08932],
-                   [6.00000, 0.55000, 0.39026, 6.91533],
-                   [6.00000, 0.60000, 0.40113, 7.16013],
-                   [6.00000, 0.65000, 0.40512, 7.39418],
-                   [6.00000, 0.70000, 0.39817, 7.36902],
-                   [6.00000, 0.75000, 0.37576, 7.03362],
-                   [6.00000, 0.50000, 0.37451, 7.55055],
-                   [6.00000, 0.55000, 0.39332, 7.40892],
-                   [6.00000, 0.60000, 0.40469, 7.66288],
-                   [6.00000, 0.65000, 0.40885, 7.84592],
-                   [6.00000, 0.70000, 0.40432, 7.86596],
-                   [6.00000, 0.75000, 0.38861, 7.24967],
-                   [6.00000, 0.50000, 0.37692, 8.05574],
-                   [6.00000, 0.55000, 0.39645, 7.91320],
-                   [6.00000, 0.60000, 0.40766, 8.13642],
-                   [6.00000, 0.65000, 0.41256, 8.29497],
-                   [6.00000, 0.70000, 0.40897, 8.30730],
-                   [6.00000, 0.75000, 0.39989, 7.71970],
-                   [6.00000, 0.50000, 0.37882, 8.51873],
-                   [6.00000, 0.55000, 0.40099, 8.70505],
-                   [6.00000, 0.60000, 0.41182, 8.79760],
-                   [6.00000, 0.65000, 0.41535, 8.71195],
-                   [6.00000, 0.70000, 0.41349, 8.71972],
-                   [6.00000, 0.75000, 0.40643, 8.13996],
-                   [6.00000, 0.50000, 0.38085, 9.01737],
-                   [6.00000, 0.55000, 0.39812, 8.19806],
-                   [6.00000, 0.60000, 0.41484, 9.33984],
-                   [6.00000, 0.65000, 0.41813, 9.14219],
-                   [6.00000, 0.70000, 0.41777, 9.18534],
-                   [6.00000, 0.50000, 0.38268, 9.51115],
-                   [6.00000, 0.55000, 0.40450, 9.32774],
-                   [6.00000, 0.60000, 0.41734, 9.80892],
-                   [6.00000, 0.65000, 0.42124, 9.59927],
-                   [6.00000, 0.70000, 0.42169, 9.65048],
-                   [6.00000, 0.50000, 0.38514, 10.21772],
-                   [6.00000, 0.55000, 0.40697, 9.79088],
-                   [6.00000, 0.60000, 0.41976, 10.23901],
-                   [6.00000, 0.65000, 0.42420, 10.04969],
-                   [6.00000, 0.70000, 0.42532, 10.15110],
-                   [6.00000, 0.50000, 0.38663, 10.72018],
-                   [6.00000, 0.55000, 0.40933, 10.23485],
-                   [6.00000, 0.60000, 0.42201, 10.69844],
-                   [6.00000, 0.65000, 0.42818, 10.69357],
-                   [6.00000, 0.70000, 0.42811, 10.56892],
-                   [6.00000, 0.50000, 0.38796, 11.22413],
-                   [6.00000, 0.55000, 0.41137, 10.69278],
-                   [6.00000, 0.60000, 0.42481, 11.29654],
-                   [6.00000, 0.65000, 0.43210, 11.37526],
-                   [6.00000, 0.70000, 0.43125, 10.99793],
-                   [6.00000, 0.50000, 0.39067, 12.06494],
-                   [6.00000, 0.55000, 0.41332, 11.08569],
-                   [6.00000, 0.60000, 0.42794, 12.04946],
-                   [6.00000, 0.65000, 0.43597, 12.07970],
-                   [6.00000, 0.70000, 0.43431, 11.47561],
-                   [6.00000, 0.55000, 0.41571, 11.59916],
-                   [6.00000, 0.70000, 0.43782, 12.08658],
-                   [6.00000, 0.55000, 0.41767, 12.07010],
-                   [6.50000, 0.50000, 0.15024, 0.41350],
-                   [6.50000, 0.55000, 0.15004, 0.42833],
-                   [6.50000, 0.60000, 0.15005, 0.42228],
-                   [6.50000, 0.65000, 0.15005, 0.42152],
-                   [6.50000, 0.70000, 0.15004, 0.44726],
-                   [6.50000, 0.75000, 0.15004, 0.45685],
-                   [6.50000, 0.80000, 0.15004, 0.48275],
-                   [6.50000, 0.50000, 0.16916, 0.40453],
-                   [6.50000, 0.55000, 0.16916, 0.41212],
-                   [6.50000, 0.60000, 0.16916, 0.41667],
-                   [6.50000, 0.65000, 0.16916, 0.45054],
-                   [6.50000, 0.70000, 0.16916, 0.44798],
-                   [6.50000, 0.75000, 0.16916, 0.52401],
-                   [6.50000, 0.80000, 0.16915, 0.66144],
-                   [6.50000, 0.50000, 0.18229, 0.41248],
-                   [6.50000, 0.55000, 0.18229, 0.42077],
-                   [6.50000, 0.60000, 0.18229, 0.41377],
-                   [6.50000, 0.65000, 0.18229, 0.42563],
-                   [6.50000, 0.70000, 0.18228, 0.48587],
-                   [6.50000, 0.75000, 0.18228, 0.59507],
-                   [6.50000, 0.80000, 0.18227, 0.80193],
-                   [6.50000, 0.50000, 0.19541, 0.43091],
-                   [6.50000, 0.55000, 0.19541, 0.43528],
-                   [6.50000, 0.60000, 0.19541, 0.42863],
-                   [6.50000, 0.65000, 0.19541, 0.46211],
-                   [6.50000, 0.70000, 0.19541, 0.54131],
-                   [6.50000, 0.75000, 0.19540, 0.69807],
-                   [6.50000, 0.80000, 0.19539, 0.97937],
-                   [6.50000, 0.50000, 0.20854, 0.44556],
-                   [6.50000, 0.55000, 0.20854, 0.44676],
-                   [6.50000, 0.60000, 0.20854, 0.45012],
-                   [6.50000, 0.65000, 0.20854, 0.51155],
-                   [6.50000, 0.70000, 0.20853, 0.63230],
-                   [6.50000, 0.75000, 0.20853, 0.82913],
-                   [6.50000, 0.80000, 0.20851, 1.19757],
-                   [6.50000, 0.50000, 0.22167, 0.46401],
-                   [6.50000, 0.55000, 0.22166, 0.48621],
-                   [6.50000, 0.60000, 0.22166, 0.48604],
-                   [6.50000, 0.65000, 0.22166, 0.58267],
-                   [6.50000, 0.70000, 0.22166, 0.74545],
-                   [6.50000, 0.75000, 0.22165, 1.00480],
-                   [6.50000, 0.80000, 0.22163, 1.47269],
-                   [6.50000, 0.50000, 0.23479, 0.48307],
-                   [6.50000, 0.55000, 0.23479, 0.52332],
-                   [6.50000, 0.60000, 0.23479, 0.56423],
-                   [6.50000, 0.65000, 0.23479, 0.67116],
-                   [6.50000, 0.70000, 0.23478, 0.90540],
-                   [6.50000, 0.75000, 0.23477, 1.22793],
-                   [6.50000, 0.80000, 0.23475, 1.81981],
-                   [6.50000, 0.50000, 0.24792, 0.52172],
-                   [6.50000, 0.55000, 0.24792, 0.58377],
-                   [6.50000, 0.60000, 0.24791, 0.67324],
-                   [6.50000, 0.65000, 0.24791, 0.82660],
-                   [6.50000, 0.70000, 0.24790, 1.10569],
-                   [6.50000, 0.75000, 0.24788, 1.53098],
-                   [6.50000, 0.80000, 0.24669, 2.23292],
-                   [6.50000, 0.50000, 0.26104, 0.58667],
-                   [6.50000, 0.55000, 0.26104, 0.68261],
-                   [6.50000, 0.60000, 0.26103, 0.85860],
-                   [6.50000, 0.65000, 0.26103, 1.07021],
-                   [6.50000, 0.70000, 0.26101, 1.42136],
-                   [6.50000, 0.75000, 0.25940, 1.91441],
-                   [6.50000, 0.80000, 0.25655, 2.65582],
-                   [6.50000, 0.50000, 0.27417, 0.66278],
-                   [6.50000, 0.55000, 0.27416, 0.82700],
-                   [6.50000, 0.60000, 0.27415, 1.08905],
-                   [6.50000, 0.65000, 0.27414, 1.42453],
-                   [6.50000, 0.70000, 0.27201, 1.80402],
-                   [6.50000, 0.75000, 0.26936, 2.36724],
-                   [6.50000, 0.80000, 0.26429, 3.05851],
-                   [6.50000, 0.50000, 0.28729, 0.77475],
-                   [6.50000, 0.55000, 0.28728, 1.00096],
-                   [6.50000, 0.60000, 0.28727, 1.40285],
-                   [6.50000, 0.65000, 0.28544, 1.83952],
-                   [6.50000, 0.70000, 0.28069, 2.22093],
-                   [6.50000, 0.75000, 0.27709, 2.79659],
-                   [6.50000, 0.80000, 0.27147, 3.50900],
-                   [6.50000, 0.50000, 0.30041, 0.94036],
-                   [6.50000, 0.55000, 0.30040, 1.18623],
-                   [6.50000, 0.60000, 0.30038, 1.70447],
-                   [6.50000, 0.65000, 0.29488, 2.28282],
-                   [6.50000, 0.70000, 0.28838, 2.66197],
-                   [6.50000, 0.75000, 0.28321, 3.23344],
-                   [6.50000, 0.80000, 0.27771, 4.00971],
-                   [6.50000, 0.50000, 0.31353, 1.18159],
-                   [6.50000, 0.55000, 0.31352, 1.40638],
-                   [6.50000, 0.60000, 0.31350, 1.92248],
-                   [6.50000, 0.65000, 0.30573, 2.70814],
-                   [6.50000, 0.70000, 0.29463, 3.09579],
-                   [6.50000, 0.75000, 0.28834, 3.67820],
-                   [6.50000, 0.80000, 0.28326, 4.50782],
-                   [6.50000, 0.50000, 0.32664, 1.52684],
-                   [6.50000, 0.55000, 0.32664, 1.66314],
-                   [6.50000, 0.60000, 0.32663, 2.04067],
-                   [6.50000, 0.65000, 0.31885, 3.00720],
-                   [6.50000, 0.70000, 0.30027, 3.52474],
-                   [6.50000, 0.75000, 0.29266, 4.12705],
-                   [6.50000, 0.80000, 0.28712, 4.91994],
-                   [6.50000, 0.50000, 0.33760, 1.97038],
-                   [6.50000, 0.55000, 0.33976, 1.99090],
-                   [6.50000, 0.60000, 0.33975, 2.19842],
-                   [6.50000, 0.65000, 0.33197, 3.15223],
-                   [6.50000, 0.70000, 0.30638, 3.99189],
-                   [6.50000, 0.75000, 0.29721, 4.56857],
-                   [6.50000, 0.80000, 0.29086, 5.37168],
-                   [6.50000, 0.50000, 0.34564, 2.42186],
-                   [6.50000, 0.55000, 0.35190, 2.37927],
-                   [6.50000, 0.60000, 0.35287, 2.50039],
-                   [6.50000, 0.65000, 0.34509, 3.26911],
-                   [6.50000, 0.70000, 0.31643, 4.47519],
-                   [6.50000, 0.75000, 0.30146, 5.02491],
-                   [6.50000, 0.80000, 0.29574, 6.04905],
-                   [6.50000, 0.50000, 0.35218, 2.86691],
-                   [6.50000, 0.55000, 0.36126, 2.82956],
-                   [6.50000, 0.60000, 0.36545, 2.93547],
-                   [6.50000, 0.65000, 0.35821, 3.45819],
-                   [6.50000, 0.70000, 0.32934, 4.72582],
-                   [6.50000, 0.75000, 0.30650, 5.50247],
-                   [6.50000, 0.50000, 0.35774, 3.30159],
-                   [6.50000, 0.55000, 0.36812, 3.27735],
-                   [6.50000, 0.60000, 0.37440, 3.35671],
-                   [6.50000, 0.65000, 0.37133, 3.77122],
-                   [6.50000, 0.70000, 0.34246, 4.71347],
-                   [6.50000, 0.75000, 0.31475, 5.97307],
-                   [6.50000, 0.50000, 0.36226, 3.73092],
-                   [6.50000, 0.55000, 0.37410, 3.71992],
-                   [6.50000, 0.60000, 0.38204, 3.78950],
-                   [6.50000, 0.65000, 0.38250, 4.23356],
-                   [6.50000, 0.70000, 0.35559, 4.74772],
-                   [6.50000, 0.75000, 0.32763, 6.24318],
-                   [6.50000, 0.50000, 0.36635, 4.15030],
-                   [6.50000, 0.55000, 0.37948, 4.16530],
-                   [6.50000, 0.60000, 0.38775, 4.22624],
-                   [6.50000, 0.65000, 0.39059, 4.65886],
-                   [6.50000, 0.70000, 0.36871, 4.91241],
-                   [6.50000, 0.75000, 0.34043, 6.22151],
-                   [6.50000, 0.50000, 0.37040, 4.58436],
-                   [6.50000, 0.55000, 0.38452, 4.60875],
-                   [6.50000, 0.60000, 0.39329, 4.67578],
-                   [6.50000, 0.65000, 0.39765, 5.08090],
-                   [6.50000, 0.70000, 0.38161, 5.21264],
-                   [6.50000, 0.75000, 0.35404, 6.04424],
-                   [6.50000, 0.50000, 0.37395, 5.02030],
-                   [6.50000, 0.55000, 0.38902, 5.05257],
-                   [6.50000, 0.60000, 0.39763, 5.08921],
-                   [6.50000, 0.65000, 0.40381, 5.53922],
-                   [6.50000, 0.70000, 0.39274, 5.66843],
-                   [6.50000, 0.75000, 0.36692, 5.95297],
-                   [6.50000, 0.50000, 0.37750, 5.46295],
-                   [6.50000, 0.55000, 0.39321, 5.51179],
-                   [6.50000, 0.60000, 0.40287, 5.52556],
-                   [6.50000, 0.65000, 0.41033, 5.99159],
-                   [6.50000, 0.70000, 0.40092, 6.08767],
-                   [6.50000, 0.75000, 0.38014, 5.97560],
-                   [6.50000, 0.50000, 0.38106, 5.91111],
-                   [6.50000, 0.55000, 0.39717, 5.96221],
-                   [6.50000, 0.60000, 0.40791, 6.00396],
-                   [6.50000, 0.65000, 0.41556, 6.41395],
-                   [6.50000, 0.70000, 0.40887, 6.53762],
-                   [6.50000, 0.75000, 0.39107, 6.13790],
-                   [6.50000, 0.50000, 0.38414, 6.33905],
-                   [6.50000, 0.55000, 0.40123, 6.41465],
-                   [6.50000, 0.60000, 0.41243, 6.46123],
-                   [6.50000, 0.65000, 0.42048, 6.83531],
-                   [6.50000, 0.70000, 0.41548, 6.95488],
-                   [6.50000, 0.75000, 0.40714, 6.67417],
-                   [6.50000, 0.50000, 0.38725, 6.78187],
-                   [6.50000, 0.55000, 0.40489, 6.84502],
-                   [6.50000, 0.60000, 0.41674, 6.89618],
-                   [6.50000, 0.65000, 0.42529, 7.29507],
-                   [6.50000, 0.70000, 0.42221, 7.42684],
-                   [6.50000, 0.75000, 0.41693, 7.13391],
-                   [6.50000, 0.50000, 0.38994, 7.18778],
-                   [6.50000, 0.55000, 0.40864, 7.27095],
-                   [6.50000, 0.60000, 0.42074, 7.31750],
-                   [6.50000, 0.65000, 0.42991, 7.73053],
-                   [6.50000, 0.70000, 0.42777, 7.84965],
-                   [6.50000, 0.50000, 0.39283, 7.64256],
-                   [6.50000, 0.55000, 0.41239, 7.70244],
-                   [6.50000, 0.60000, 0.42461, 7.77289],
-                   [6.50000, 0.65000, 0.43422, 8.15806],
-                   [6.50000, 0.70000, 0.43151, 8.19271],
-                   [6.50000, 0.50000, 0.39599, 8.09130],
-                   [6.50000, 0.55000, 0.41636, 8.12619],
-                   [6.50000, 0.60000, 0.42885, 8.24700],
-                   [6.50000, 0.65000, 0.43854, 8.60148],
-                   [6.50000, 0.50000, 0.39909, 8.55571],
-                   [6.50000, 0.55000, 0.42033, 8.56464],
-                   [6.50000, 0.60000, 0.43250, 8.68814],
-                   [6.50000, 0.65000, 0.44236, 9.04445],
-                   [6.50000, 0.50000, 0.40202, 9.00651],
-                   [6.50000, 0.55000, 0.42420, 9.00470],
-                   [6.50000, 0.60000, 0.43645, 9.10411],
-                   [6.50000, 0.65000, 0.44632, 9.49789],
-                   [6.50000, 0.50000, 0.40513, 9.42114],
-                   [6.50000, 0.55000, 0.42858, 9.45185],
-                   [6.50000, 0.60000, 0.44020, 9.52432],
-                   [6.50000, 0.65000, 0.44982, 9.89243],
-                   [6.50000, 0.50000, 0.40845, 9.89181],
-                   [6.50000, 0.55000, 0.43266, 9.89102],
-                   [6.50000, 0.60000, 0.44402, 9.93819],
-                   [6.50000, 0.50000, 0.41157, 10.31823],
-                   [6.50000, 0.55000, 0.43684, 10.31900],
-                   [6.50000, 0.60000, 0.44982, 10.50296],
-                   [6.50000, 0.50000, 0.41530, 10.76689],
-                   [6.50000, 0.55000, 0.44123, 10.75867],
-                   [6.50000, 0.50000, 0.41896, 11.17536],
-                   [6.50000, 0.55000, 0.44574, 11.19323],
-                   [6.50000, 0.50000, 0.42341, 11.65396],
-                   [6.50000, 0.55000, 0.44977, 11.55224],
-                   [6.50000, 0.50000, 0.42665, 11.95583],
-                   [7.00000, 0.50000, 0.15007, 0.33706],
-                   [7.00000, 0.55000, 0.15007, 0.35267],
-                   [7.00000, 0.60000, 0.15007, 0.34916],
-                   [7.00000, 0.65000, 0.15007, 0.36785],
-                   [7.00000, 0.70000, 0.15007, 0.36148],
-                   [7.00000, 0.75000, 0.15014, 0.40042],
-                   [7.00000, 0.80000, 0.15007, 0.47525],
-                   [7.00000, 0.50000, 0.16921, 0.34217],
-                   [7.00000, 0.55000, 0.16921, 0.35747],
-                   [7.00000, 0.60000, 0.16921, 0.37082],
-                   [7.00000, 0.65000, 0.16921, 0.38084],
-                   [7.00000, 0.70000, 0.16921, 0.37052],
-                   [7.00000, 0.75000, 0.17008, 0.44946],
-                   [7.00000, 0.80000, 0.16920, 0.61631],
-                   [7.00000, 0.50000, 0.18242, 0.35082],
-                   [7.00000, 0.55000, 0.18242, 0.35474],
-                   [7.00000, 0.60000, 0.18242, 0.38211],
-                   [7.00000, 0.65000, 0.18242, 0.40324],
-                   [7.00000, 0.70000, 0.18242, 0.42157],
-                   [7.00000, 0.75000, 0.18328, 0.51354],
-                   [7.00000, 0.80000, 0.18241, 0.74941],
-                   [7.00000, 0.50000, 0.19563, 0.36467],
-                   [7.00000, 0.55000, 0.19563, 0.36731],
-                   [7.00000, 0.60000, 0.19563, 0.41777],
-                   [7.00000, 0.65000, 0.19563, 0.43582],
-                   [7.00000, 0.70000, 0.19563, 0.48166],
-                   [7.00000, 0.75000, 0.19649, 0.60158],
-                   [7.00000, 0.80000, 0.19562, 0.91044],
-                   [7.00000, 0.50000, 0.20884, 0.38902],
-                   [7.00000, 0.55000, 0.20884, 0.39227],
-                   [7.00000, 0.60000, 0.20884, 0.38939],
-                   [7.00000, 0.65000, 0.20884, 0.46754],
-                   [7.00000, 0.70000, 0.20884, 0.56901],
-                   [7.00000, 0.75000, 0.20970, 0.73376],
-                   [7.00000, 0.80000, 0.20882, 1.11546],
-                   [7.00000, 0.50000, 0.22205, 0.40379],
-                   [7.00000, 0.55000, 0.22205, 0.43371],
-                   [7.00000, 0.60000, 0.22205, 0.43244],
-                   [7.00000, 0.65000, 0.22205, 0.53300],
-                   [7.00000, 0.70000, 0.22204, 0.67041],
-                   [7.00000, 0.75000, 0.22290, 0.90257],
-                   [7.00000, 0.80000, 0.22202, 1.37399],
-                   [7.00000, 0.50000, 0.23526, 0.43370],
-                   [7.00000, 0.55000, 0.23526, 0.49138],
-                   [7.00000, 0.60000, 0.23526, 0.48827],
-                   [7.00000, 0.65000, 0.23526, 0.62329],
-                   [7.00000, 0.70000, 0.23525, 0.80828],
-                   [7.00000, 0.75000, 0.23611, 1.12277],
-                   [7.00000, 0.80000, 0.23522, 1.69319],
-                   [7.00000, 0.50000, 0.24847, 0.45324],
-                   [7.00000, 0.55000, 0.24847, 0.50653],
-                   [7.00000, 0.60000, 0.24847, 0.58463],
-                   [7.00000, 0.65000, 0.24846, 0.75290],
-                   [7.00000, 0.70000, 0.24845, 1.01730],
-                   [7.00000, 0.75000, 0.24931, 1.42455],
-                   [7.00000, 0.80000, 0.24842, 2.11651],
-                   [7.00000, 0.50000, 0.26168, 0.50590],
-                   [7.00000, 0.55000, 0.26168, 0.63096],
-                   [7.00000, 0.60000, 0.26167, 0.75495],
-                   [7.00000, 0.65000, 0.26167, 0.96249],
-                   [7.00000, 0.70000, 0.26166, 1.30398],
-                   [7.00000, 0.75000, 0.26218, 1.82563],
-                   [7.00000, 0.80000, 0.26010, 2.57691],
-                   [7.00000, 0.50000, 0.27489, 0.57533],
-                   [7.00000, 0.55000, 0.27489, 0.72065],
-                   [7.00000, 0.60000, 0.27488, 0.95825],
-                   [7.00000, 0.65000, 0.27487, 1.28603],
-                   [7.00000, 0.70000, 0.27388, 1.69626],
-                   [7.00000, 0.75000, 0.27245, 2.25470],
-                   [7.00000, 0.80000, 0.26988, 3.03039],
-                   [7.00000, 0.50000, 0.28810, 0.66467],
-                   [7.00000, 0.55000, 0.28809, 0.84508],
-                   [7.00000, 0.60000, 0.28808, 1.21755],
-                   [7.00000, 0.65000, 0.28644, 1.66540],
-                   [7.00000, 0.70000, 0.28404, 2.13352],
-                   [7.00000, 0.75000, 0.28167, 2.72772],
-                   [7.00000, 0.80000, 0.27679, 3.45511],
-                   [7.00000, 0.50000, 0.30130, 0.80680],
-                   [7.00000, 0.55000, 0.30130, 0.99321],
-                   [7.00000, 0.60000, 0.30128, 1.48915],
-                   [7.00000, 0.65000, 0.29801, 2.08496],
-                   [7.00000, 0.70000, 0.29296, 2.60180],
-                   [7.00000, 0.75000, 0.28865, 3.17512],
-                   [7.00000, 0.80000, 0.28354, 3.93680],
-                   [7.00000, 0.50000, 0.31451, 1.02279],
-                   [7.00000, 0.55000, 0.31450, 1.17105],
-                   [7.00000, 0.60000, 0.31449, 1.64577],
-                   [7.00000, 0.65000, 0.31121, 2.40770],
-                   [7.00000, 0.70000, 0.30119, 3.06150],
-                   [7.00000, 0.75000, 0.29459, 3.63733],
-                   [7.00000, 0.80000, 0.29047, 4.47248],
-                   [7.00000, 0.50000, 0.32771, 1.32660],
-                   [7.00000, 0.55000, 0.32771, 1.36538],
-                   [7.00000, 0.60000, 0.32769, 1.76183],
-                   [7.00000, 0.65000, 0.32442, 2.55706],
-                   [7.00000, 0.70000, 0.31204, 3.47471],
-                   [7.00000, 0.75000, 0.30076, 4.13830],
-                   [7.00000, 0.80000, 0.29783, 5.10886],
-                   [7.00000, 0.50000, 0.34005, 1.73738],
-                   [7.00000, 0.55000, 0.34091, 1.64666],
-                   [7.00000, 0.60000, 0.34090, 1.89285],
-                   [7.00000, 0.65000, 0.33763, 2.64685],
-                   [7.00000, 0.70000, 0.32525, 3.66349],
-                   [7.00000, 0.75000, 0.31021, 4.65991],
-                   [7.00000, 0.50000, 0.34941, 2.13995],
-                   [7.00000, 0.55000, 0.35389, 2.01728],
-                   [7.00000, 0.60000, 0.35410, 2.09692],
-                   [7.00000, 0.65000, 0.35083, 2.77632],
-                   [7.00000, 0.70000, 0.33846, 3.73841],
-                   [7.00000, 0.75000, 0.32260, 5.02814],
-                   [7.00000, 0.50000, 0.35799, 2.60055],
-                   [7.00000, 0.55000, 0.36474, 2.46471],
-                   [7.00000, 0.60000, 0.36797, 2.48393],
-                   [7.00000, 0.65000, 0.36404, 2.98969],
-                   [7.00000, 0.70000, 0.35167, 3.76701],
-                   [7.00000, 0.75000, 0.33543, 5.12554],
-                   [7.00000, 0.50000, 0.36460, 3.02882],
-                   [7.00000, 0.55000, 0.37357, 2.91289],
-                   [7.00000, 0.60000, 0.37923, 2.91213],
-                   [7.00000, 0.65000, 0.37707, 3.31476],
-                   [7.00000, 0.70000, 0.36487, 3.83575],
-                   [7.00000, 0.75000, 0.34902, 5.06719],
-                   [7.00000, 0.50000, 0.37086, 3.49362],
-                   [7.00000, 0.55000, 0.38059, 3.34331],
-                   [7.00000, 0.60000, 0.38828, 3.34960],
-                   [7.00000, 0.65000, 0.38967, 3.75021],
-                   [7.00000, 0.70000, 0.37778, 4.00563],
-                   [7.00000, 0.75000, 0.36124, 4.98214],
-                   [7.00000, 0.50000, 0.37725, 3.95971],
-                   [7.00000, 0.55000, 0.38740, 3.77841],
-                   [7.00000, 0.60000, 0.39671, 3.81122],
-                   [7.00000, 0.65000, 0.40062, 4.22495],
-                   [7.00000, 0.70000, 0.39224, 4.35549],
-                   [7.00000, 0.75000, 0.37535, 4.93430],
-                   [7.00000, 0.50000, 0.38286, 4.39929],
-                   [7.00000, 0.55000, 0.39395, 4.23689],
-                   [7.00000, 0.60000, 0.40444, 4.24715],
-                   [7.00000, 0.65000, 0.40923, 4.64366],
-                   [7.00000, 0.70000, 0.40512, 4.79616],
-                   [7.00000, 0.75000, 0.38911, 4.96555],
-                   [7.00000, 0.50000, 0.38843, 4.87512],
-                   [7.00000, 0.55000, 0.39928, 4.64969],
-                   [7.00000, 0.60000, 0.41011, 4.65935],
-                   [7.00000, 0.65000, 0.41798, 5.08212],
-                   [7.00000, 0.70000, 0.41615, 5.26015],
-                   [7.00000, 0.75000, 0.40169, 5.12659],
-                   [7.00000, 0.50000, 0.39329, 5.28334],
-                   [7.00000, 0.55000, 0.40501, 5.10294],
-                   [7.00000, 0.60000, 0.41573, 5.08416],
-                   [7.00000, 0.65000, 0.42611, 5.53251],
-                   [7.00000, 0.70000, 0.42654, 5.66421],
-                   [7.00000, 0.75000, 0.41503, 5.39114],
-                   [7.00000, 0.50000, 0.39804, 5.70256],
-                   [7.00000, 0.55000, 0.41051, 5.56360],
-                   [7.00000, 0.60000, 0.42195, 5.54924],
-                   [7.00000, 0.65000, 0.43401, 6.00056],
-                   [7.00000, 0.70000, 0.43746, 6.12249],
-                   [7.00000, 0.75000, 0.42794, 5.77484],
-                   [7.00000, 0.50000, 0.40311, 6.14630],
-                   [7.00000, 0.55000, 0.41589, 5.98867],
-                   [7.00000, 0.60000, 0.42759, 5.99956],
-                   [7.00000, 0.65000, 0.43980, 6.41239],
-                   [7.00000, 0.70000, 0.45020, 6.68304],
-                   [7.00000, 0.75000, 0.44081, 6.22309],
-                   [7.00000, 0.50000, 0.40819, 6.58333],
-                   [7.00000, 0.55000, 0.42086, 6.40219],
-                   [7.00000, 0.60000, 0.43299, 6.45524],
-                   [7.00000, 0.65000, 0.44606, 6.89404],
-                   [7.00000, 0.75000, 0.45037, 6.57835],
-                   [7.00000, 0.50000, 0.41337, 7.03031],
-                   [7.00000, 0.55000, 0.42583, 6.83923],
-                   [7.00000, 0.60000, 0.43808, 6.91208],
-                   [7.00000, 0.65000, 0.45025, 7.21906],
-                   [7.00000, 0.50000, 0.41855, 7.47261],
-                   [7.00000, 0.55000, 0.43112, 7.28935],
-                   [7.00000, 0.60000, 0.44303, 7.34645],
-                   [7.00000, 0.50000, 0.42397, 7.91538],
-                   [7.00000, 0.55000, 0.43663, 7.73157],
-                   [7.00000, 0.60000, 0.45058, 7.96212],
-                   [7.00000, 0.50000, 0.42980, 8.35926],
-                   [7.00000, 0.55000, 0.44257, 8.16223],
-                   [7.00000, 0.50000, 0.43582, 8.80229],
-                   [7.00000, 0.55000, 0.45079, 8.70902],
-                   [7.00000, 0.50000, 0.44186, 9.24264],
-                   [7.00000, 0.50000, 0.45061, 9.82996],
-                   [7.50000, 0.50000, 0.15021, 0.33312],
-                   [7.50000, 0.55000, 0.15021, 0.33400],
-                   [7.50000, 0.60000, 0.15042, 0.33197],
-                   [7.50000, 0.65000, 0.15020, 0.32116],
-                   [7.50000, 0.70000, 0.15020, 0.32239],
-                   [7.50000, 0.75000, 0.14997, 0.33477],
-                   [7.50000, 0.80000, 0.15021, 0.43243],
-                   [7.50000, 0.50000, 0.16913, 0.32414],
-                   [7.50000, 0.55000, 0.16913, 0.33440],
-                   [7.50000, 0.60000, 0.16934, 0.32184],
-                   [7.50000, 0.65000, 0.16913, 0.32936],
-                   [7.50000, 0.70000, 0.16913, 0.34009],
-                   [7.50000, 0.75000, 0.17085, 0.39923],
-                   [7.50000, 0.80000, 0.16914, 0.55466],
-                   [7.50000, 0.50000, 0.18221, 0.32430],
-                   [7.50000, 0.55000, 0.18221, 0.33721],
-                   [7.50000, 0.60000, 0.18242, 0.32227],
-                   [7.50000, 0.65000, 0.18221, 0.34080],
-                   [7.50000, 0.70000, 0.18221, 0.36752],
-                   [7.50000, 0.75000, 0.18393, 0.47075],
-                   [7.50000, 0.80000, 0.18222, 0.66989],
-                   [7.50000, 0.50000, 0.19528, 0.33415],
-                   [7.50000, 0.55000, 0.19528, 0.34171],
-                   [7.50000, 0.60000, 0.19549, 0.32799],
-                   [7.50000, 0.65000, 0.19528, 0.36020],
-                   [7.50000, 0.70000, 0.19528, 0.41695],
-                   [7.50000, 0.75000, 0.19701, 0.56651],
-                   [7.50000, 0.80000, 0.19530, 0.82089],
-                   [7.50000, 0.50000, 0.20835, 0.33673],
-                   [7.50000, 0.55000, 0.20836, 0.35326],
-                   [7.50000, 0.60000, 0.20857, 0.33410],
-                   [7.50000, 0.65000, 0.20836, 0.39950],
-                   [7.50000, 0.70000, 0.20836, 0.48155],
-                   [7.50000, 0.75000, 0.21009, 0.68876],
-                   [7.50000, 0.80000, 0.20839, 1.00788],
-                   [7.50000, 0.50000, 0.22143, 0.35279],
-                   [7.50000, 0.55000, 0.22143, 0.36848],
-                   [7.50000, 0.60000, 0.22164, 0.36620],
-                   [7.50000, 0.65000, 0.22143, 0.45766],
-                   [7.50000, 0.70000, 0.22144, 0.58442],
-                   [7.50000, 0.75000, 0.22317, 0.84366],
-                   [7.50000, 0.80000, 0.22147, 1.24186],
-                   [7.50000, 0.50000, 0.23450, 0.36691],
-                   [7.50000, 0.55000, 0.23451, 0.40380],
-                   [7.50000, 0.60000, 0.23472, 0.41256],
-                   [7.50000, 0.65000, 0.23451, 0.52752],
-                   [7.50000, 0.70000, 0.23452, 0.71183],
-                   [7.50000, 0.75000, 0.23625, 1.04490],
-                   [7.50000, 0.80000, 0.23456, 1.54297],
-                   [7.50000, 0.50000, 0.24758, 0.39543],
-                   [7.50000, 0.55000, 0.24758, 0.45683],
-                   [7.50000, 0.60000, 0.24780, 0.50418],
-                   [7.50000, 0.65000, 0.24759, 0.64867],
-                   [7.50000, 0.70000, 0.24773, 0.89394],
-                   [7.50000, 0.75000, 0.24934, 1.32274],
-                   [7.50000, 0.80000, 0.24765, 1.90231],
-                   [7.50000, 0.50000, 0.26066, 0.41356],
-                   [7.50000, 0.55000, 0.26066, 0.53368],
-                   [7.50000, 0.60000, 0.26088, 0.65508],
-                   [7.50000, 0.65000, 0.26068, 0.82867],
-                   [7.50000, 0.70000, 0.26069, 1.12189],
-                   [7.50000, 0.75000, 0.26243, 1.65460],
-                   [7.50000, 0.80000, 0.26010, 2.30736],
-                   [7.50000, 0.50000, 0.27373, 0.48868],
-                   [7.50000, 0.55000, 0.27374, 0.62055],
-                   [7.50000, 0.60000, 0.27397, 0.85321],
-                   [7.50000, 0.65000, 0.27376, 1.09618],
-                   [7.50000, 0.70000, 0.27378, 1.47555],
-                   [7.50000, 0.75000, 0.27477, 2.05664],
-                   [7.50000, 0.80000, 0.27106, 2.71775],
-                   [7.50000, 0.50000, 0.28681, 0.54895],
-                   [7.50000, 0.55000, 0.28682, 0.74138],
-                   [7.50000, 0.60000, 0.28705, 1.07776],
-                   [7.50000, 0.65000, 0.28685, 1.44577],
-                   [7.50000, 0.70000, 0.28623, 1.91749],
-                   [7.50000, 0.75000, 0.28478, 2.47631],
-                   [7.50000, 0.80000, 0.28137, 3.18314],
-                   [7.50000, 0.50000, 0.29989, 0.64883],
-                   [7.50000, 0.55000, 0.29990, 0.88093],
-                   [7.50000, 0.60000, 0.30013, 1.27695],
-                   [7.50000, 0.65000, 0.29995, 1.78612],
-                   [7.50000, 0.70000, 0.29751, 2.40630],
-                   [7.50000, 0.75000, 0.29312, 2.87637],
-                   [7.50000, 0.80000, 0.29072, 3.65702],
-                   [7.50000, 0.50000, 0.31297, 0.80895],
-                   [7.50000, 0.55000, 0.31298, 1.02880],
-                   [7.50000, 0.60000, 0.31322, 1.42074],
-                   [7.50000, 0.65000, 0.31303, 2.01411],
-                   [7.50000, 0.70000, 0.30942, 2.76383],
-                   [7.50000, 0.75000, 0.30190, 3.37924],
-                   [7.50000, 0.80000, 0.29815, 4.09876],
-                   [7.50000, 0.50000, 0.32606, 1.05469],
-                   [7.50000, 0.55000, 0.32606, 1.19332],
-                   [7.50000, 0.60000, 0.32629, 1.49638],
-                   [7.50000, 0.65000, 0.32611, 2.11620],
-                   [7.50000, 0.70000, 0.32251, 2.94201],
-                   [7.50000, 0.75000, 0.31336, 3.81207],
-                   [7.50000, 0.80000, 0.30603, 4.56317],
-                   [7.50000, 0.50000, 0.33915, 1.39830],
-                   [7.50000, 0.55000, 0.33915, 1.38188],
-                   [7.50000, 0.60000, 0.33937, 1.58626],
-                   [7.50000, 0.65000, 0.33919, 2.17071],
-                   [7.50000, 0.70000, 0.33558, 3.01374],
-                   [7.50000, 0.75000, 0.32612, 4.01445],
-                   [7.50000, 0.80000, 0.31762, 5.04484],
-                   [7.50000, 0.50000, 0.35085, 1.80673],
-                   [7.50000, 0.55000, 0.35224, 1.67152],
-                   [7.50000, 0.60000, 0.35245, 1.73792],
-                   [7.50000, 0.65000, 0.35090, 2.24286],
-                   [7.50000, 0.70000, 0.34866, 3.04202],
-                   [7.50000, 0.75000, 0.34019, 4.07581],
-                   [7.50000, 0.50000, 0.36095, 2.27981],
-                   [7.50000, 0.55000, 0.36522, 2.03234],
-                   [7.50000, 0.60000, 0.36554, 2.02927],
-                   [7.50000, 0.65000, 0.36728, 2.45092],
-                   [7.50000, 0.70000, 0.36173, 3.04603],
-                   [7.50000, 0.75000, 0.35350, 4.05117],
-                   [7.50000, 0.50000, 0.36965, 2.71066],
-                   [7.50000, 0.55000, 0.37650, 2.48118],
-                   [7.50000, 0.60000, 0.37864, 2.39526],
-                   [7.50000, 0.65000, 0.38037, 2.73505],
-                   [7.50000, 0.70000, 0.37481, 3.08471],
-                   [7.50000, 0.75000, 0.36650, 4.00061],
-                   [7.50000, 0.50000, 0.37728, 3.11893],
-                   [7.50000, 0.55000, 0.38659, 2.91413],
-                   [7.50000, 0.60000, 0.39162, 2.82719],
-                   [7.50000, 0.65000, 0.39346, 3.12462],
-                   [7.50000, 0.70000, 0.38789, 3.25353],
-                   [7.50000, 0.75000, 0.37957, 3.95455],
-                   [7.50000, 0.50000, 0.38469, 3.56814],
-                   [7.50000, 0.55000, 0.39558, 3.36734],
-                   [7.50000, 0.60000, 0.40365, 3.25462],
-                   [7.50000, 0.65000, 0.40655, 3.52959],
-                   [7.50000, 0.70000, 0.40098, 3.53580],
-                   [7.50000, 0.75000, 0.39261, 3.95380],
-                   [7.50000, 0.50000, 0.39232, 4.01709],
-                   [7.50000, 0.55000, 0.40391, 3.75242],
-                   [7.50000, 0.60000, 0.41406, 3.67153],
-                   [7.50000, 0.65000, 0.41835, 3.95378],
-                   [7.50000, 0.70000, 0.41407, 3.92051],
-                   [7.50000, 0.75000, 0.40572, 4.03490],
-                   [7.50000, 0.50000, 0.39995, 4.45839],
-                   [7.50000, 0.55000, 0.41398, 4.23590],
-                   [7.50000, 0.60000, 0.42416, 4.07756],
-                   [7.50000, 0.65000, 0.43085, 4.39073],
-                   [7.50000, 0.70000, 0.42685, 4.36648],
-                   [7.50000, 0.75000, 0.41901, 4.20695],
-                   [7.50000, 0.50000, 0.40726, 4.88618],
-                   [7.50000, 0.55000, 0.42247, 4.67071],
-                   [7.50000, 0.60000, 0.43580, 4.57417],
-                   [7.50000, 0.65000, 0.44101, 4.79590],
-                   [7.50000, 0.70000, 0.43910, 4.78576],
-                   [7.50000, 0.75000, 0.43178, 4.44831],
-                   [7.50000, 0.50000, 0.41479, 5.34144],
-                   [7.50000, 0.55000, 0.43160, 5.11341],
-                   [7.50000, 0.60000, 0.44887, 5.12241],
-                   [7.50000, 0.65000, 0.44933, 5.13700],
-                   [7.50000, 0.70000, 0.44988, 5.15476],
-                   [7.50000, 0.75000, 0.45053, 4.91106],
-                   [7.50000, 0.50000, 0.42252, 5.77750],
-                   [7.50000, 0.55000, 0.44134, 5.55342],
-                   [7.50000, 0.50000, 0.43037, 6.20540],
-                   [7.50000, 0.55000, 0.44947, 5.93062],
-                   [7.50000, 0.50000, 0.43821, 6.64167],
-                   [7.50000, 0.50000, 0.44996, 7.28178],
-                   [8.00000, 0.50000, 0.15022, 0.25106],
-                   [8.00000, 0.55000, 0.15022, 0.27552],
-                   [8.00000, 0.60000, 0.15087, 0.26866],
-                   [8.00000, 0.65000, 0.15022, 0.27625],
-                   [8.00000, 0.70000, 0.15002, 0.27575],
-                   [8.00000, 0.75000, 0.15022, 0.26292],
-                   [8.00000, 0.80000, 0.15021, 0.36188],
-                   [8.00000, 0.50000, 0.16932, 0.26769],
-                   [8.00000, 0.55000, 0.16932, 0.28311],
-                   [8.00000, 0.60000, 0.16997, 0.27480],
-                   [8.00000, 0.65000, 0.16932, 0.28078],
-                   [8.00000, 0.70000, 0.16932, 0.29316],
-                   [8.00000, 0.75000, 0.16932, 0.30690],
-                   [8.00000, 0.80000, 0.16930, 0.48986],
-                   [8.00000, 0.50000, 0.18252, 0.27678],
-                   [8.00000, 0.55000, 0.18252, 0.29004],
-                   [8.00000, 0.60000, 0.18317, 0.28202],
-                   [8.00000, 0.65000, 0.18252, 0.28900],
-                   [8.00000, 0.70000, 0.18252, 0.33402],
-                   [8.00000, 0.75000, 0.18252, 0.37071],
-                   [8.00000, 0.80000, 0.18249, 0.60348],
-                   [8.00000, 0.50000, 0.19573, 0.28435],
-                   [8.00000, 0.55000, 0.19572, 0.30263],
-                   [8.00000, 0.60000, 0.19637, 0.29946],
-                   [8.00000, 0.65000, 0.19572, 0.31025],
-                   [8.00000, 0.70000, 0.19572, 0.37870],
-                   [8.00000, 0.75000, 0.19571, 0.45972],
-                   [8.00000, 0.80000, 0.19568, 0.75564],
-                   [8.00000, 0.50000, 0.20893, 0.29771],
-                   [8.00000, 0.55000, 0.20892, 0.31691],
-                   [8.00000, 0.60000, 0.20957, 0.30686],
-                   [8.00000, 0.65000, 0.20892, 0.33960],
-                   [8.00000, 0.70000, 0.20891, 0.43563],
-                   [8.00000, 0.75000, 0.20890, 0.58040],
-                   [8.00000, 0.80000, 0.20886, 0.94568],
-                   [8.00000, 0.50000, 0.22213, 0.30630],
-                   [8.00000, 0.55000, 0.22212, 0.32759],
-                   [8.00000, 0.60000, 0.22277, 0.35895],
-                   [8.00000, 0.65000, 0.22212, 0.38870],
-                   [8.00000, 0.70000, 0.22211, 0.51901],
-                   [8.00000, 0.75000, 0.22208, 0.73515],
-                   [8.00000, 0.80000, 0.22204, 1.19496],
-                   [8.00000, 0.50000, 0.23533, 0.31332],
-                   [8.00000, 0.55000, 0.23532, 0.35530],
-                   [8.00000, 0.60000, 0.23597, 0.40137],
-                   [8.00000, 0.65000, 0.23531, 0.46979],
-                   [8.00000, 0.70000, 0.23530, 0.63080],
-                   [8.00000, 0.75000, 0.23527, 0.92958],
-                   [8.00000, 0.80000, 0.23521, 1.48341],
-                   [8.00000, 0.50000, 0.24853, 0.34031],
-                   [8.00000, 0.55000, 0.24852, 0.40007],
-                   [8.00000, 0.60000, 0.24916, 0.47603],
-                   [8.00000, 0.65000, 0.24850, 0.57018],
-                   [8.00000, 0.70000, 0.24848, 0.77583],
-                   [8.00000, 0.75000, 0.24845, 1.16725],
-                   [8.00000, 0.80000, 0.24838, 1.82203],
-                   [8.00000, 0.50000, 0.26173, 0.37370],
-                   [8.00000, 0.55000, 0.26172, 0.47527],
-                   [8.00000, 0.60000, 0.26235, 0.59086],
-                   [8.00000, 0.65000, 0.26169, 0.72608],
-                   [8.00000, 0.70000, 0.26166, 1.01792],
-                   [8.00000, 0.75000, 0.26162, 1.47241],
-                   [8.00000, 0.80000, 0.26155, 2.20534],
-                   [8.00000, 0.50000, 0.27492, 0.42153],
-                   [8.00000, 0.55000, 0.27491, 0.57142],
-                   [8.00000, 0.60000, 0.27554, 0.74453],
-                   [8.00000, 0.65000, 0.27487, 0.96112],
-                   [8.00000, 0.70000, 0.27483, 1.33929],
-                   [8.00000, 0.75000, 0.27478, 1.84878],
-                   [8.00000, 0.80000, 0.27404, 2.59114],
-                   [8.00000, 0.50000, 0.28812, 0.48219],
-                   [8.00000, 0.55000, 0.28810, 0.66899],
-                   [8.00000, 0.60000, 0.28873, 0.92189],
-                   [8.00000, 0.65000, 0.28804, 1.26111],
-                   [8.00000, 0.70000, 0.28799, 1.75096],
-                   [8.00000, 0.75000, 0.28740, 2.25368],
-                   [8.00000, 0.80000, 0.28715, 3.04210],
-                   [8.00000, 0.50000, 0.30131, 0.57218],
-                   [8.00000, 0.55000, 0.30129, 0.78518],
-                   [8.00000, 0.60000, 0.30191, 1.10906],
-                   [8.00000, 0.65000, 0.30122, 1.54350],
-                   [8.00000, 0.70000, 0.30116, 2.13774],
-                   [8.00000, 0.75000, 0.29885, 2.67410],
-                   [8.00000, 0.80000, 0.29756, 3.45767],
-                   [8.00000, 0.50000, 0.31450, 0.72391],
-                   [8.00000, 0.55000, 0.31448, 0.90680],
-                   [8.00000, 0.60000, 0.31510, 1.22503],
-                   [8.00000, 0.65000, 0.31440, 1.69161],
-                   [8.00000, 0.70000, 0.31434, 2.33308],
-                   [8.00000, 0.75000, 0.31005, 3.02916],
-                   [8.00000, 0.80000, 0.30757, 3.90000],
-                   [8.00000, 0.50000, 0.32768, 0.94427],
-                   [8.00000, 0.55000, 0.32767, 1.02765],
-                   [8.00000, 0.60000, 0.32829, 1.28698],
-                   [8.00000, 0.65000, 0.32760, 1.70123],
-                   [8.00000, 0.70000, 0.32754, 2.39189],
-                   [8.00000, 0.75000, 0.32369, 3.16682],
-                   [8.00000, 0.80000, 0.32150, 4.29912],
-                   [8.00000, 0.50000, 0.34085, 1.26582],
-                   [8.00000, 0.55000, 0.34086, 1.18114],
-                   [8.00000, 0.60000, 0.34149, 1.35851],
-                   [8.00000, 0.65000, 0.34081, 1.69395],
-                   [8.00000, 0.70000, 0.34074, 2.37172],
-                   [8.00000, 0.75000, 0.33713, 3.15253],
-                   [8.00000, 0.80000, 0.33515, 4.36743],
-                   [8.00000, 0.50000, 0.35315, 1.66279],
-                   [8.00000, 0.55000, 0.35404, 1.37349],
-                   [8.00000, 0.60000, 0.35468, 1.49622],
-                   [8.00000, 0.65000, 0.35400, 1.74769],
-                   [8.00000, 0.70000, 0.35395, 2.31090],
-                   [8.00000, 0.75000, 0.35063, 3.03660],
-                   [8.00000, 0.80000, 0.34792, 4.25650],
-                   [8.00000, 0.50000, 0.36479, 2.11981],
-                   [8.00000, 0.55000, 0.36721, 1.70403],
-                   [8.00000, 0.60000, 0.36786, 1.70716],
-                   [8.00000, 0.65000, 0.36719, 1.88147],
-                   [8.00000, 0.70000, 0.36707, 2.30025],
-                   [8.00000, 0.75000, 0.36424, 2.98705],
-                   [8.00000, 0.80000, 0.36080, 4.11339],
-                   [8.00000, 0.50000, 0.37538, 2.57222],
-                   [8.00000, 0.55000, 0.37929, 2.11948],
-                   [8.00000, 0.60000, 0.37952, 1.97122],
-                   [8.00000, 0.65000, 0.38037, 2.10056],
-                   [8.00000, 0.70000, 0.38054, 2.36782],
-                   [8.00000, 0.75000, 0.37704, 2.99105],
-                   [8.00000, 0.80000, 0.37810, 3.97014],
-                   [8.00000, 0.50000, 0.38496, 3.00237],
-                   [8.00000, 0.55000, 0.39065, 2.57600],
-                   [8.00000, 0.60000, 0.39462, 2.48260],
-                   [8.00000, 0.65000, 0.39354, 2.43941],
-                   [8.00000, 0.70000, 0.39353, 2.57743],
-                   [8.00000, 0.75000, 0.39004, 3.07802],
-                   [8.00000, 0.50000, 0.39587, 3.44015],
-                   [8.00000, 0.55000, 0.40290, 3.04564],
-                   [8.00000, 0.60000, 0.40735, 2.87510],
-                   [8.00000, 0.65000, 0.40670, 2.84031],
-                   [8.00000, 0.70000, 0.40670, 2.89035],
-                   [8.00000, 0.75000, 0.40377, 3.21756],
-                   [8.00000, 0.50000, 0.40742, 3.86375],
-                   [8.00000, 0.55000, 0.41513, 3.45945],
-                   [8.00000, 0.60000, 0.42052, 3.21726],
-                   [8.00000, 0.65000, 0.41987, 3.16585],
-                   [8.00000, 0.70000, 0.41987, 3.15899],
-                   [8.00000, 0.75000, 0.41601, 3.38117],
-                   [8.00000, 0.50000, 0.42020, 4.28053],
-                   [8.00000, 0.55000, 0.42825, 3.84098],
-                   [8.00000, 0.60000, 0.43369, 3.53311],
-                   [8.00000, 0.65000, 0.43305, 3.44977],
-                   [8.00000, 0.70000, 0.43305, 3.41174],
-                   [8.00000, 0.50000, 0.43336, 4.62667],
-                   [8.00000, 0.55000, 0.44142, 4.14231],
-                   [8.00000, 0.60000, 0.45018, 3.81902],
-                   [8.00000, 0.65000, 0.45026, 3.67852],
-                   [8.00000, 0.50000, 0.44996, 4.94379],
-                   [8.00000, 0.55000, 0.44989, 4.32022],
-                   ], dtype=float)
+CR_TABLE_TEXT = os.path.join(os.path.dirname(__file__), 'cr.txt')
+CR_TABLE = os.path.join(os.path.dirname(__file__), 'cr.npy')
+
+
+@lru_cache(maxsize=1)
+def residual_resistance_table() -> np.ndarray:
+    """
+    Residual resistance coefficient table, loaded on first use.
+
+    The binary copy is memory mapped, the text table it is converted from is only parsed if the copy is missing.
+
+    :return: (N, 4) slenderness coefficient, prismatic coefficient, Froude number and 1000 Cr of every tabulated point
+    """
+    if os.path.exists(CR_TABLE):
+        return np.asarray(np.load(CR_TABLE, mmap_mode='r'), dtype=np.float64)
+    return np.loadtxt(CR_TABLE_TEXT)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Table derived constants are resolved lazily, so importing this module does not read the table.
+    """
+    if name == 'CRLIST':
+        return residual_resistance_table()
+    if name == 'CRPOINTS':
+        return residual_resistance_table()[:, :3]
+    if name == 'CRVALUES':
+        return residual_resistance_table()[:, 3] / 1000
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Conventional standard gravity m/s^2 and sea water density kg/m^3
+GRAVITY = 9.80665
+SEA_WATER_DENSITY = 1025
+
+# Kinematic viscosity of sea water against temperature
+# Data from http://web.mit.edu/seawater/2017_MIT_Seawater_Property_Tables_r2.pdf
+VISCOSITY_TEMPERATURES = np.array([0, 10, 20, 25, 30, 40], dtype=np.float64)
+KINEMATIC_VISCOSITIES = np.array([18.54, 13.60, 10.50, 9.37, 8.42, 6.95]) / 10 ** 7
+
 
-CRPOINTS = CRLIST.T[:3].T
-CRVALUES = CRLIST.T[3].T / 1000
-CR = interpolate.LinearNDInterpolator(CRPOINTS, CRVALUES)
-CRNEAREST = interpolate.NearestNDInterpolator(CRPOINTS, CRVALUES)
+if __name__ == '__main__':
+    # Regenerate the binary copy of the table after editing cr.txt: python -m PyResis.constants
+    np.save(CR_TABLE, np.loadtxt(CR_TABLE_TEXT))
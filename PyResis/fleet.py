@@ -0,0 +1,112 @@
+"""
+Batch evaluation of many ships at once.
+
+Every argument is broadcast against the others, so a fleet of N ships is evaluated with a handful of NumPy calls
+instead of N :class:`PyResis.ship.Ship` objects. The arguments are in the order of the :class:`PyResis.ship.Ship`
+ones, beam included although it does not enter the resistance estimation.
+
+When numexpr is installed the final resistance and power expressions are evaluated by it in a single pass, without
+the temporary arrays NumPy allocates for every intermediate product.
+"""
+from typing import Dict, Union
+
+import numpy as np
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
+from PyResis import vectorized
+from PyResis.constants import SEA_WATER_DENSITY
+
+
+def sweep(**axes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Open grid of the given axes for a design space sweep, in the manner of :data:`numpy.ogrid`.
+
+    Axis number i is reshaped to length one in every dimension but the i-th, so the inputs are not expanded to the
+    full Cartesian product as with :func:`numpy.meshgrid`. The batch functions evaluate every term on the broadcast of
+    only the axes it depends on, the residual resistance lookup and the result are the only full size arrays when
+    the axes it takes are swept. For a 200 x 200 x 200 sweep that is 600 input values rather than 3 x 8 million.
+
+    >>> axes = sweep(speed=np.linspace(1, 5, 5), length=[20, 30, 40], draught=[1.0, 1.5])
+    >>> {name: axis.shape for name, axis in axes.items()}
+    {'speed': (5, 1, 1), 'length': (1, 3, 1), 'draught': (1, 1, 2)}
+    >>> propulsion_power_batch(beam=6.0, slenderness_coefficient=6.5, prismatic_coefficient=0.65, **axes).shape
+    (5, 3, 2)
+
+    :param axes: one dimensional values of each swept parameter, keyed by parameter name
+    :return: the axes reshaped to broadcast against each other, in the order given
+    """
+    shape = [1] * len(axes)
+    grid = {}
+    for dimension, (name, axis) in enumerate(axes.items()):
+        shape[dimension] = -1
+        grid[name] = np.asarray(axis, dtype=np.float64).reshape(shape)
+        shape[dimension] = 1
+    return grid
+
+
+def resistance_batch(length: np.ndarray, draught: np.ndarray, beam: np.ndarray,  # pylint: disable=unused-argument
+                     speed: np.ndarray, slenderness_coefficient: np.ndarray, prismatic_coefficient: np.ndarray,
+                     temperature: Union[float, np.ndarray] = 25) -> np.ndarray:
+    """
+    Resistance of a batch of ships.
+
+    :param length: metres length of the vehicles
+    :param draught: metres draught of the vehicles
+    :param beam: metres beam of the vehicles, not used
+    :param speed: m/s speed of the vehicles
+    :param slenderness_coefficient: Slenderness coefficient dimensionless :math:`L/(∇^{1/3})` where L is length of
+        ship, ∇ is displacement
+    :param prismatic_coefficient: Prismatic coefficient dimensionless :math:`∇/(L\\cdot A_m)` where L is length of
+        ship, ∇ is displacement Am is midsection area of the ship
+    :param temperature: degree C of the sea water
+    :return: newton the resistance of the ships
+    """
+    length, draught, speed, slenderness_coefficient, prismatic_coefficient = (
+        np.asarray(arg, dtype=np.float64) for arg in
+        (length, draught, speed, slenderness_coefficient, prismatic_coefficient))
+    # every term broadcasts only the arguments it depends on, the residual resistance lookup all but draught
+    length_over_slenderness = length / slenderness_coefficient
+    displacement = length_over_slenderness * length_over_slenderness * length_over_slenderness
+    surface_area = 1.025 * (1.7 * length * draught + displacement / draught)
+    total_resistance_coef = vectorized.frictional_resistance_coef(length, speed, temperature=temperature) + \
+        vectorized.residual_resistance_coef(slenderness_coefficient, prismatic_coefficient,
+                                            vectorized.froude_number(speed, length))
+    if numexpr is not None:
+        return np.asarray(numexpr.evaluate('0.5 * density * surface_area * speed * speed * total_resistance_coef',
+                                           local_dict={'density': float(SEA_WATER_DENSITY),
+                                                       'surface_area': surface_area, 'speed': speed,
+                                                       'total_resistance_coef': total_resistance_coef}))
+    return np.asarray(1 / 2 * SEA_WATER_DENSITY * surface_area * total_resistance_coef * speed * speed)
+
+
+def propulsion_power_batch(length: np.ndarray, draught: np.ndarray, beam: np.ndarray, speed: np.ndarray,
+                           slenderness_coefficient: np.ndarray, prismatic_coefficient: np.ndarray,
+                           propulsion_eff: Union[float, np.ndarray] = 0.7, sea_margin: Union[float, np.ndarray] = 0.2,
+                           temperature: Union[float, np.ndarray] = 25) -> np.ndarray:
+    """
+    Total propulsion power of a batch of ships.
+
+    :param length: metres length of the vehicles
+    :param draught: metres draught of the vehicles
+    :param beam: metres beam of the vehicles, not used
+    :param speed: m/s speed of the vehicles
+    :param slenderness_coefficient: Slenderness coefficient dimensionless :math:`L/(∇^{1/3})` where L is length of
+        ship, ∇ is displacement
+    :param prismatic_coefficient: Prismatic coefficient dimensionless :math:`∇/(L\\cdot A_m)` where L is length of
+        ship, ∇ is displacement Am is midsection area of the ship
+    :param propulsion_eff: Shaft efficiency of the ships
+    :param sea_margin: Sea margin take account of interaction between ship and the sea, e.g. wave
+    :param temperature: degree C of the sea water
+    :return: Watts shaft propulsion power of the ships
+    """
+    resistance = resistance_batch(length, draught, beam, speed, slenderness_coefficient, prismatic_coefficient,
+                                  temperature=temperature)
+    if numexpr is not None:
+        return np.asarray(numexpr.evaluate('(1 + sea_margin) * resistance * speed / propulsion_eff',
+                                           local_dict={'sea_margin': sea_margin, 'resistance': resistance,
+                                                       'speed': speed, 'propulsion_eff': propulsion_eff}))
+    return np.asarray((1 + sea_margin) * resistance * speed / propulsion_eff)
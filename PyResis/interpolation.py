@@ -0,0 +1,284 @@
+"""
+Interpolators of the residual resistance coefficient table.
+
+SciPy is only imported on first use, for the k-d tree of the first batch nearest neighbour query and for the
+triangulation of :class:`SimplexCachedInterpolator`. Without it the batch queries fall back to a NumPy search and the
+triangulation is NaN everywhere, with a warning, so the residual resistance falls back to the nearest tabulated value.
+"""
+import itertools
+import warnings
+from functools import cached_property, lru_cache
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from PyResis import _cr_pythran
+from PyResis._kernels import nearest_index, trilerp
+
+
+@lru_cache(maxsize=1)
+def _scipy_spatial():
+    """
+    Import :mod:`scipy.spatial` on first use.
+
+    :return: the module, None if SciPy is not installed
+    """
+    try:
+        from scipy import spatial  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return None
+    return spatial
+
+
+@lru_cache(maxsize=1)
+def _scipy_interpolate():
+    """
+    Import :mod:`scipy.interpolate` on first use.
+
+    :return: the module, None if SciPy is not installed
+    """
+    try:
+        from scipy import interpolate  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        warnings.warn('SciPy is not installed, Cr falls back to the nearest tabulated value', RuntimeWarning)
+        return None
+    return interpolate
+
+
+def _split_coordinates(args: tuple, ndim: int) -> tuple:
+    """
+    Accept the call forms of the SciPy interpolators: one coordinate per dimension, a tuple of them, or a single
+    (..., ndim) array of points.
+
+    :param args: positional arguments of the interpolator call
+    :param ndim: number of dimensions of the data points
+    :return: one coordinate per dimension
+    """
+    if len(args) != 1 or ndim == 1:
+        return args
+    if isinstance(args[0], tuple):
+        return args[0]
+    points = np.asarray(args[0], dtype=np.float64)
+    if points.shape[-1:] != (ndim,):
+        raise ValueError(f'points must have shape (..., {ndim}) but have shape {points.shape}')
+    return tuple(np.moveaxis(points, -1, 0))
+
+
+class SimplexCachedInterpolator:
+    """
+    Piecewise linear interpolator on a Delaunay triangulation that remembers the last simplex it evaluated.
+
+    Successive scalar queries (e.g. an optimizer nudging one design) usually land in the same simplex, in which
+    case the qhull simplex search is skipped entirely and only the barycentric weights are recomputed.
+    """
+
+    def __init__(self, points: np.ndarray, values: np.ndarray, tol: float = 1e-12) -> None:
+        """
+        Store the scattered data points, they are triangulated on the first query inside their bounding box.
+
+        :param points: (N, ndim) coordinates of the data points
+        :param values: (N,) data values at the points
+        :param tol: tolerance used to decide whether a point lies inside a simplex
+        """
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.tol = tol
+        self.lower, self.upper = self.points.min(axis=0), self.points.max(axis=0)
+        self._last_simplex = -1
+
+    @cached_property
+    def _interpolator(self) -> Optional[Callable[..., np.ndarray]]:
+        interpolate = _scipy_interpolate()
+        return None if interpolate is None else interpolate.LinearNDInterpolator(self.points, self.values)
+
+    @property
+    def tri(self):
+        """
+        Delaunay triangulation of the data points.
+        """
+        return self._interpolator.tri
+
+    def _barycentric(self, simplex: int, point: np.ndarray) -> np.ndarray:
+        transform = self.tri.transform[simplex]
+        ndim = self.tri.ndim
+        partial = transform[:ndim].dot(point - transform[ndim])
+        return np.append(partial, 1 - partial.sum())
+
+    def __call__(self, *args):
+        """
+        Evaluate the interpolant, scalar coordinates take the cached path, anything else goes to SciPy.
+
+        :return: interpolated value, NaN outside of the convex hull of the data points or if SciPy is not installed
+        """
+        args = _split_coordinates(args, self.points.shape[1])
+        if any(np.ndim(arg) for arg in args):
+            coordinates = np.broadcast_arrays(*args)
+            inside = np.ones(coordinates[0].shape, dtype=bool)
+            for lower, upper, coordinate in zip(self.lower, self.upper, coordinates):
+                inside &= (lower <= coordinate) & (coordinate <= upper)
+            # the convex hull lies within the bounding box, points outside of it need no triangulation
+            value = np.full(coordinates[0].shape, np.nan)
+            interpolator = self._interpolator if inside.any() else None
+            if interpolator is not None:
+                value[inside] = interpolator(*(coordinate[inside] for coordinate in coordinates))
+            return value
+
+        inside = all(lower <= arg <= upper for lower, upper, arg in zip(self.lower, self.upper, args))
+        if not inside or self._interpolator is None:
+            return np.nan
+        point = np.array(args, dtype=np.float64)
+        simplex = self._last_simplex
+        if simplex != -1:
+            weights = self._barycentric(simplex, point)
+            if weights.min() < -self.tol:
+                simplex = -1
+        if simplex == -1:
+            simplex = int(self.tri.find_simplex(point, bruteforce=False, tol=self.tol))
+            if simplex == -1:
+                return np.nan
+            self._last_simplex = simplex
+            weights = self._barycentric(simplex, point)
+        return float(weights.dot(self.values[self.tri.simplices[simplex]]))
+
+
+class NearestInterpolator:
+    """
+    Nearest neighbour interpolator, same as :class:`scipy.interpolate.NearestNDInterpolator` without its generic input
+    handling. Scalar queries use the brute force :func:`PyResis._kernels.nearest_index`, which compiled is faster than
+    a k-d tree query on a table of a few thousand points. Array queries use a k-d tree when SciPy is installed.
+    """
+
+    def __init__(self, points: np.ndarray, values: np.ndarray, chunk_size: int = 1024) -> None:
+        """
+        Store the data points.
+
+        :param points: (N, ndim) coordinates of the data points
+        :param values: (N,) data values at the points
+        :param chunk_size: number of query points compared against all data points at once without SciPy
+        """
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.chunk_size = chunk_size
+
+    @cached_property
+    def tree(self):
+        """
+        k-d tree of the data points, built on the first array query, None if SciPy is not installed.
+        """
+        spatial = _scipy_spatial()
+        return None if spatial is None else spatial.cKDTree(self.points)
+
+    def _index(self, xi: np.ndarray) -> np.ndarray:
+        if self.tree is not None:
+            return np.asarray(self.tree.query(xi)[1], dtype=np.intp)
+        if not np.isfinite(xi).all():
+            raise ValueError('query points must be finite')
+        # |x - p|^2 = |x|^2 - 2 x.p + |p|^2, |x|^2 does not change which p is the nearest
+        squared_norms = (self.points ** 2).sum(axis=1)
+        index = np.empty(len(xi), dtype=np.intp)
+        for start in range(0, len(xi), self.chunk_size):
+            chunk = xi[start:start + self.chunk_size]
+            index[start:start + self.chunk_size] = np.argmin(squared_norms - 2 * chunk @ self.points.T, axis=1)
+        return index
+
+    def __call__(self, *args):
+        """
+        Evaluate the interpolant.
+
+        :return: value of the data point nearest to the query point
+        """
+        args = _split_coordinates(args, self.points.shape[1])
+        if not any(np.ndim(arg) for arg in args):
+            return float(self.values[nearest_index(self.points, np.array(args, dtype=np.float64))])
+        coordinates = np.broadcast_arrays(*args)
+        xi = np.stack(coordinates, axis=-1).reshape(-1, len(coordinates)).astype(np.float64)
+        return self.values[self._index(xi)].reshape(coordinates[0].shape)
+
+
+def rectilinear_grid(points: np.ndarray, values: np.ndarray) -> Optional[Tuple[Tuple[np.ndarray, ...], np.ndarray]]:
+    """
+    Resample curves tabulated on a grid of their leading coordinates onto a full rectilinear grid.
+
+    The residual resistance table is a grid in (slenderness, prismatic coefficient), but every curve is digitised at
+    its own Froude numbers. Each curve is linearly resampled onto the union of all last coordinates, which reproduces
+    it exactly. Values beyond the ends of a curve are NaN, so are the interpolated values of any grid cell touching
+    them and the caller decides how to extrapolate.
+
+    :param points: (N, ndim) coordinates of the data points
+    :param values: (N,) data values at the points
+    :return: axes and (len(axis_0), ..., len(axis_n)) values of the grid, None if the leading coordinates are not a grid
+    """
+    leading_axes = [np.unique(column) for column in points[:, :-1].T]
+    last_axis = np.unique(points[:, -1])
+    shape = tuple(len(axis) for axis in leading_axes)
+    index = tuple(np.searchsorted(axis, column) for axis, column in zip(leading_axes, points[:, :-1].T))
+    flat_index = np.ravel_multi_index(index, shape)
+    if len(np.unique(flat_index)) != np.prod(shape):
+        return None
+
+    grid = np.empty((int(np.prod(shape)), len(last_axis)))
+    for cell in range(grid.shape[0]):
+        curve = flat_index == cell
+        order = np.argsort(points[curve, -1])
+        grid[cell] = np.interp(last_axis, points[curve, -1][order], values[curve][order], left=np.nan, right=np.nan)
+    return (*leading_axes, last_axis), grid.reshape(shape + (len(last_axis),))
+
+
+class GridInterpolator:
+    """
+    Linear interpolator on a rectilinear grid, called with one coordinate per dimension like the scattered ones.
+
+    Scalar queries on a three dimensional grid go through the compiled :func:`PyResis._kernels.trilerp`, which reuses
+    the grid cell of the previous query when the new point still falls into it. Array queries go through the Pythran
+    compiled :func:`PyResis._cr_pythran.trilerp` when that extension has been built, and through NumPy otherwise.
+    """
+
+    def __init__(self, axes: Tuple[np.ndarray, ...], grid: np.ndarray) -> None:
+        """
+        Store the grid.
+
+        :param axes: strictly ascending coordinates of the grid along each dimension
+        :param grid: values on the grid
+        """
+        self.axes = tuple(np.ascontiguousarray(axis, dtype=np.float64) for axis in axes)
+        self.grid = np.ascontiguousarray(grid, dtype=np.float64)
+        self._last_cell = np.zeros(len(axes), dtype=np.int64)
+
+    def _multilinear(self, coordinates: Tuple[np.ndarray, ...]) -> np.ndarray:
+        # cells and fractions keep the shape of their own coordinate, only the weights and values are broadcast
+        shape = np.broadcast_shapes(*(coordinate.shape for coordinate in coordinates))
+        cells, fractions = [], []
+        outside = np.zeros(shape, dtype=bool)
+        for axis, coordinate in zip(self.axes, coordinates):
+            cell = np.clip(np.searchsorted(axis, coordinate, side='right') - 1, 0, len(axis) - 2)
+            cells.append(cell)
+            fractions.append((coordinate - axis[cell]) / (axis[cell + 1] - axis[cell]))
+            outside |= ~((axis[0] <= coordinate) & (coordinate <= axis[-1]))
+
+        value = np.zeros(shape)
+        weight = np.empty(shape)
+        for corner in itertools.product((0, 1), repeat=len(self.axes)):
+            weight[...] = 1
+            for offset, fraction in zip(corner, fractions):
+                weight *= fraction if offset else 1 - fraction
+            corner_value = self.grid[tuple(cell + offset for cell, offset in zip(cells, corner))]
+            corner_value *= weight
+            value += corner_value
+        value[outside] = np.nan
+        return value
+
+    def __call__(self, *args):
+        """
+        Evaluate the interpolant.
+
+        :return: interpolated value, NaN outside of the grid or next to a NaN grid value
+        """
+        args = _split_coordinates(args, len(self.axes))
+        if len(args) == 3 and self.grid.ndim == 3 and not any(np.ndim(arg) for arg in args):
+            return trilerp(self.grid, *self.axes, *(float(arg) for arg in args), self._last_cell)
+        if len(args) == 3 and self.grid.ndim == 3 and hasattr(_cr_pythran, '__pythran__'):
+            coordinates = np.broadcast_arrays(*args)
+            flat = (np.ascontiguousarray(coordinate, dtype=np.float64).ravel() for coordinate in coordinates)
+            return _cr_pythran.trilerp(self.grid, *self.axes, *flat).reshape(coordinates[0].shape)
+        value = self._multilinear(tuple(np.asarray(arg, dtype=np.float64) for arg in args))
+        return float(value) if value.ndim == 0 else value
@@ -1,9 +1,42 @@
 import math
+from functools import lru_cache
+from typing import Any
 
 import numpy as np
-from scipy import interpolate
 
-from PyResis.constants import CR, CRNEAREST
+from PyResis._kernels import ittc_friction_line
+from PyResis.constants import residual_resistance_table, GRAVITY, VISCOSITY_TEMPERATURES, KINEMATIC_VISCOSITIES
+
+
+@lru_cache(maxsize=1)
+def residual_resistance_interpolators():
+    """
+    Build the residual resistance coefficient interpolators on first use.
+
+    :return: interpolators of the table to try in turn, every one NaN where it does not cover the query point but the
+        last, nearest neighbour, one
+    """
+    from PyResis import interpolation  # pylint: disable=import-outside-toplevel
+
+    table = residual_resistance_table()
+    points, values = np.array(table[:, :3]), table[:, 3] / 1000
+    grid = interpolation.rectilinear_grid(points, values)
+    # The table is digitised on a (slenderness, prismatic coefficient) grid, the Delaunay triangulation of the table
+    # only fills in the grid cells beyond the Froude number range of a curve, or everything if it is not a grid
+    linear = [] if grid is None else [interpolation.GridInterpolator(*grid)]
+    return (*linear, interpolation.SimplexCachedInterpolator(points, values),
+            interpolation.NearestInterpolator(points, values))
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Linear interpolator, NaN outside of the table, and nearest neighbour interpolator of the table, as the SciPy
+    LinearNDInterpolator and NearestNDInterpolator this module imported from :mod:`PyResis.constants`, built lazily.
+    """
+    if name in ('CR', 'CRNEAREST'):
+        *_, linear, nearest = residual_resistance_interpolators()
+        return linear if name == 'CR' else nearest
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def residual_resistance_coef(slenderness: float, prismatic_coef: float, froude_number: float) -> float:
@@ -15,11 +48,11 @@ def residual_resistance_coef(slenderness: float, prismatic_coef: float, froude_n
     :param froude_number: Froude number of the ship dimensionless
     :return: Residual resistance of the ship
     """
-    crvalue = CR(slenderness, prismatic_coef, froude_number)
-    if math.isnan(crvalue):
-        crvalue = CRNEAREST(slenderness, prismatic_coef, froude_number)
-
     # if Froude number is out of interpolation range, nearest extrapolation is used
+    for interpolator in residual_resistance_interpolators():
+        crvalue = interpolator(slenderness, prismatic_coef, froude_number)
+        if not math.isnan(crvalue):
+            break
     return float(crvalue)
 
 
@@ -31,8 +64,21 @@ def froude_number(speed: float, length: float) -> float:
     :param length: metres length of the vehicle
     :return: Froude number of the vehicle (dimensionless)
     """
-    g = 9.80665  # conventional standard value m/s^2
-    return float(speed / np.sqrt(g * length))
+    return speed / math.sqrt(GRAVITY * length)
+
+
+def kinematic_viscosity(temperature: float = 25) -> float:
+    """
+    Kinematic viscosity of sea water linearly interpolated at given temperature.
+
+        Kinematic viscosity from: http://web.mit.edu/seawater/2017_MIT_Seawater_Property_Tables_r2.pdf
+
+    :param temperature: degree C, within the 0 - 40 degree C range of the table
+    :return: m^2/s kinematic viscosity of sea water
+    """
+    if not VISCOSITY_TEMPERATURES[0] <= temperature <= VISCOSITY_TEMPERATURES[-1]:
+        raise ValueError(f'temperature {temperature} degree C is outside of the 0 - 40 degree C range of the table')
+    return float(np.interp(temperature, VISCOSITY_TEMPERATURES, KINEMATIC_VISCOSITIES))
 
 
 def reynolds_number(length: float, speed: float, temperature: float = 25) -> float:
@@ -40,16 +86,11 @@ def reynolds_number(length: float, speed: float, temperature: float = 25) -> flo
     Reynold number utility function that return Reynold number for vehicle at specific length and speed.
     Optionally, it can also take account of temperature effect of sea water.
 
-        Kinematic viscosity from: http://web.mit.edu/seawater/2017_MIT_Seawater_Property_Tables_r2.pdf
-
     :param length: metres length of the vehicle
     :param speed: m/s speed of the vehicle
     :param temperature: degree C
     :return: Reynolds number of the vehicle (dimensionless)
     """
-    kinematic_viscosity = interpolate.interp1d([0, 10, 20, 25, 30, 40],
-                                               np.array([18.54, 13.60, 10.50, 9.37, 8.42, 6.95]) / 10 ** 7)
-    # Data from http://web.mit.edu/seawater/2017_MIT_Seawater_Property_Tables_r2.pdf
     return float(length * speed / kinematic_viscosity(temperature))
 
 
@@ -63,4 +104,8 @@ def frictional_resistance_coef(length: float, speed: float, **kwargs) -> float:
     :param kwargs: optional could take in temperature to take account change of water property
     :return: Frictional resistance coefficient of the vehicle
     """
-    return float(0.075 / (np.log10(reynolds_number(length, speed, **kwargs)) - 2) ** 2)
\ No newline at end of file
+    reynolds = reynolds_number(length, speed, **kwargs)
+    if reynolds == 0:
+        # 0.075 / (log10(0) - 2)^2 = 0.075 / inf, the vehicle is at rest
+        return 0.0
+    return float(ittc_friction_line(math.log10(reynolds)))
\ No newline at end of file
@@ -1,12 +1,22 @@
-from PyResis.physics import residual_resistance_coef, froude_number, reynolds_number, frictional_resistance_coef
+import math
+from functools import cached_property
+from typing import Callable, Union
+
+import numpy as np
+
+from PyResis import physics, vectorized
+from PyResis._kernels import ittc_friction_line, resistance_kernel
+from PyResis.constants import GRAVITY, SEA_WATER_DENSITY
 
 
 class Ship:
     """
     Class of ship object, can be initialize with zero argument.
+
+    The ship is treated as immutable once constructed, derived quantities are computed once and cached.
     """
 
-    def __init__(self, length: float, draught: float, beam: float, speed: float,
+    def __init__(self, length: float, draught: float, beam: float, speed: Union[float, np.ndarray],
                  slenderness_coefficient: float, prismatic_coefficient: float) -> None:
         """
         Assign values for the main dimension of a ship.
@@ -14,7 +24,7 @@ class Ship:
         :param length: metres length of the vehicle
         :param draught: metres draught of the vehicle
         :param beam: metres beam of the vehicle
-        :param speed: m/s speed of the vehicle
+        :param speed: m/s speed of the vehicle, an array of speeds evaluates the ship at all of them at once
         :param slenderness_coefficient: Slenderness coefficient dimensionless :math:`L/(∇^{1/3})` where L is length of ship,
             ∇ is displacement
         :param prismatic_coefficient: Prismatic coefficient dimensionless :math:`∇/(L\cdot A_m)` where L is length of ship,
@@ -23,24 +33,67 @@ class Ship:
         self.length = length
         self.draught = draught
         self.beam = beam
-        self.speed = speed
+        self.speed = np.asarray(speed, dtype=np.float64) if np.ndim(speed) else float(speed)
         self.slenderness_coefficient = slenderness_coefficient
         self.prismatic_coefficient = prismatic_coefficient
-        self.displacement = (self.length / self.slenderness_coefficient) ** 3
+        length_over_slenderness = self.length / self.slenderness_coefficient
+        self.displacement = length_over_slenderness * length_over_slenderness * length_over_slenderness
         self.surface_area = 1.025 * (1.7 * self.length * self.draught + self.displacement / self.draught)
 
-    @property
-    def resistance(self) -> float:
+        # scalar or vectorized implementation of the physics functions depending on the speed given
+        self._physics = vectorized if np.ndim(self.speed) else physics
+        self._half_rho_surface_area = 1 / 2 * SEA_WATER_DENSITY * self.surface_area
+        self._froude_number = self._physics.froude_number(self.speed, self.length)
+        # Reynolds number split into its speed invariant part, log10(L V / nu) = log10(L / nu) + log10(V)
+        self._log10_length_over_viscosity = math.log10(self.length / physics.kinematic_viscosity())
+
+    @cached_property
+    def _residual_resistance_coef(self) -> Union[float, np.ndarray]:
+        """
+        Residual resistance coefficient of the ship, looked up on first use.
+        """
+        residual_resistance_coef: Union[float, np.ndarray] = self._physics.residual_resistance_coef(
+            self.slenderness_coefficient, self.prismatic_coefficient, self._froude_number)
+        return residual_resistance_coef
+
+    @cached_property
+    def resistance(self) -> Union[float, np.ndarray]:
         """
         Return resistance of the vehicle.
 
         :return: newton the resistance of the ship
         """
-        total_resistance_coef = frictional_resistance_coef(self.length, self.speed) + \
-                                residual_resistance_coef(self.slenderness_coefficient,
-                                                         self.prismatic_coefficient,
-                                                         froude_number(self.speed, self.length))
-        return 1 / 2 * total_resistance_coef * 1025 * self.surface_area * self.speed ** 2
+        if isinstance(self.speed, float):
+            return resistance_kernel(self._log10_length_over_viscosity, self.speed, self._half_rho_surface_area,
+                                     float(self._residual_resistance_coef))
+        total_resistance_coef = self._physics.frictional_resistance_coef(self.length, self.speed) + \
+            self._residual_resistance_coef
+        resistance: np.ndarray = self._half_rho_surface_area * total_resistance_coef * self.speed * self.speed
+        return resistance
+
+    def compile_speed_kernel(self) -> Callable[[float], float]:
+        """
+        Return the resistance of this hull as a function of speed only, for optimizers sweeping the speed.
+
+        The function is generated at run time with every speed invariant term folded into a literal, only the
+        Froude number dependent residual resistance coefficient is still looked up per call.
+
+        :return: function of m/s speed returning newton the resistance of the ship
+        """
+        # repr of NumPy scalars is np.float64(...), the literals need to be Python floats
+        half_rho_surface_area = float(self._half_rho_surface_area)
+        log10_length_over_viscosity = float(self._log10_length_over_viscosity)
+        slenderness_coefficient = float(self.slenderness_coefficient)
+        prismatic_coefficient = float(self.prismatic_coefficient)
+        inverse_sqrt_g_l = 1 / math.sqrt(GRAVITY * self.length)
+        source = (f'lambda v: {half_rho_surface_area!r} * '
+                  f'(friction_line({log10_length_over_viscosity!r} + log10(v)) + '
+                  f'cr({slenderness_coefficient!r}, {prismatic_coefficient!r}, v * {inverse_sqrt_g_l!r}))'
+                  f' * v * v if v else 0.0')
+        namespace = {'log10': math.log10, 'friction_line': ittc_friction_line, 'cr': physics.residual_resistance_coef}
+        code = compile(source, '<ship speed kernel>', 'eval')
+        kernel: Callable[[float], float] = eval(code, namespace)  # pylint: disable=eval-used
+        return kernel
 
     def maximum_deck_area(self, water_plane_coef: float = 0.88) -> float:
         """
@@ -51,16 +104,17 @@ class Ship:
         """
         return self.beam * self.length * water_plane_coef
 
-    @property
-    def reynold_number(self) -> float:
+    @cached_property
+    def reynold_number(self) -> Union[float, np.ndarray]:
         """
         Return Reynold number of the ship
 
         :return: Reynold number of the ship
         """
-        return reynolds_number(self.length, self.speed)
+        reynolds_number: Union[float, np.ndarray] = self._physics.reynolds_number(self.length, self.speed)
+        return reynolds_number
 
-    def propulsion_power(self, propulsion_eff: float = 0.7, sea_margin: float = 0.2) -> float:
+    def propulsion_power(self, propulsion_eff: float = 0.7, sea_margin: float = 0.2) -> Union[float, np.ndarray]:
         """
         Total propulsion power of the ship.
 
@@ -68,4 +122,5 @@ class Ship:
         :param sea_margin: Sea margin take account of interaction between ship and the sea, e.g. wave
         :return: Watts shaft propulsion power of the ship
         """
-        return (1 + sea_margin) * self.resistance * self.speed / propulsion_eff
+        power: Union[float, np.ndarray] = (1 + sea_margin) * self.resistance * self.speed / propulsion_eff
+        return power
@@ -0,0 +1,90 @@
+"""
+NumPy versions of the functions in :mod:`PyResis.physics` for array inputs.
+
+The functions in :mod:`PyResis.physics` use the ``math`` module and are meant for scalar evaluation, the ones here
+accept anything broadcastable and return arrays. With numba installed the element-wise functions are compiled
+ufuncs, multithreaded from :data:`PyResis._kernels.PARALLEL_SIZE` elements on.
+"""
+from typing import Union
+
+import numpy as np
+
+from PyResis._kernels import element_wise_kernels, element_wise_target
+from PyResis.constants import VISCOSITY_TEMPERATURES, KINEMATIC_VISCOSITIES
+from PyResis.physics import residual_resistance_interpolators
+
+
+def residual_resistance_coef(slenderness: np.ndarray, prismatic_coef: np.ndarray,
+                             froude_number: np.ndarray) -> np.ndarray:
+    """
+    Residual resistance coefficient estimation from slenderness function, prismatic coefficient and Froude number.
+
+    :param slenderness: Slenderness coefficient dimensionless :math:`L/(∇^{1/3})` where L is length of ship,
+        ∇ is displacement
+    :param prismatic_coef: Prismatic coefficient dimensionless :math:`∇/(L\\cdot A_m)` where L is length of ship,
+        ∇ is displacement Am is midsection area of the ship
+    :param froude_number: Froude number of the ship dimensionless
+    :return: Residual resistance of the ship
+    """
+    linear, *fallbacks = residual_resistance_interpolators()
+    # the first interpolator takes the arguments unbroadcast, only the points it leaves NaN are gathered for the others
+    crvalue = np.asarray(linear(slenderness, prismatic_coef, froude_number), dtype=np.float64)
+    coordinates = np.broadcast_arrays(slenderness, prismatic_coef, froude_number)
+    # if Froude number is out of interpolation range, nearest extrapolation is used
+    for interpolator in fallbacks:
+        missing = np.isnan(crvalue)
+        if not missing.any():
+            break
+        crvalue[missing] = interpolator(*(coordinate[missing] for coordinate in coordinates))
+    return crvalue
+
+
+def froude_number(speed: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """
+    Froude number utility function that return Froude number for vehicle at specific length and speed.
+
+    :param speed: m/s speed of the vehicle
+    :param length: metres length of the vehicle
+    :return: Froude number of the vehicle (dimensionless)
+    """
+    froude_number_ufunc, _ = element_wise_kernels(element_wise_target(speed, length))
+    return froude_number_ufunc(speed, length)
+
+
+def kinematic_viscosity(temperature: Union[float, np.ndarray] = 25) -> np.ndarray:
+    """
+    Kinematic viscosity of sea water linearly interpolated at given temperature.
+
+    :param temperature: degree C, within the 0 - 40 degree C range of the table
+    :return: m^2/s kinematic viscosity of sea water
+    """
+    temperatures = np.asarray(temperature, dtype=np.float64)
+    if not ((VISCOSITY_TEMPERATURES[0] <= temperatures) & (temperatures <= VISCOSITY_TEMPERATURES[-1])).all():
+        raise ValueError('temperature is outside of the 0 - 40 degree C range of the table')
+    return np.interp(temperatures, VISCOSITY_TEMPERATURES, KINEMATIC_VISCOSITIES)
+
+
+def reynolds_number(length: np.ndarray, speed: np.ndarray, temperature: Union[float, np.ndarray] = 25) -> np.ndarray:
+    """
+    Reynold number utility function that return Reynold number for vehicle at specific length and speed.
+
+    :param length: metres length of the vehicle
+    :param speed: m/s speed of the vehicle
+    :param temperature: degree C
+    :return: Reynolds number of the vehicle (dimensionless)
+    """
+    return np.asarray(length * speed / kinematic_viscosity(temperature), dtype=np.float64)
+
+
+def frictional_resistance_coef(length: np.ndarray, speed: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Flat plate frictional resistance of the ship according to ITTC formula.
+
+    :param length: metres length of the vehicle
+    :param speed: m/s speed of the vehicle
+    :param kwargs: optional could take in temperature to take account change of water property
+    :return: Frictional resistance coefficient of the vehicle
+    """
+    viscosity = kinematic_viscosity(**kwargs)
+    _, frictional_resistance_coef_ufunc = element_wise_kernels(element_wise_target(length, speed, viscosity))
+    return frictional_resistance_coef_ufunc(length, speed, viscosity)
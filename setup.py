@@ -5,6 +5,7 @@ setuptools.setup(
     version='1.0.2',
     packages=setuptools.find_packages(exclude=["tests", "test.*", "test*.*", "docs", "assets", "config",
                                                "internal", "venv"]),
+    package_data={'PyResis': ['cr.txt', 'cr.npy']},
     url='https://github.com/MaritimeRenewable/PyResis',
     license='MIT',
     author='Yu Cao',
@@ -19,5 +20,9 @@ setuptools.setup(
         filter(
             lambda r: not r.startswith("#"), (r.replace("\n", "") for r in open("requirements.txt").readlines())
         )
-    )
+    ),
+    extras_require={
+        'numba': ['numba'],
+        'numexpr': ['numexpr'],
+    }
 )
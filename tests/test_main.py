@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 import logging
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
+import numpy as np
+
+try:
+    import scipy
+except ImportError:  # pragma: no cover
+    scipy = None
+
+from PyResis import _cr_pythran, _kernels, interpolation, physics, vectorized
+from PyResis.constants import residual_resistance_table
+from PyResis.fleet import propulsion_power_batch
 from PyResis.ship import Ship
 
 LOG = logging.getLogger(__name__)
@@ -17,3 +27,153 @@ class Main(TestCase):
         test for general call
         """
         self.assertEqual(0.1611291212508747, Ship(5.72, 0.248, 0.76, 0.2, 6.99, 0.613).propulsion_power())
+
+    def test_zero_speed(self):
+        r"""
+        test that a ship at rest has no resistance
+        """
+        ship = Ship(5.72, 0.248, 0.76, 0.0, 6.99, 0.613)
+        self.assertEqual(0.0, physics.frictional_resistance_coef(5.72, 0.0))
+        self.assertEqual(0.0, ship.propulsion_power())
+        self.assertEqual(0.0, ship.compile_speed_kernel()(0.0))
+        with np.errstate(divide='raise', invalid='raise'):
+            ships = Ship(5.72, 0.248, 0.76, np.array([0.0, 1.0]), 6.99, 0.613)
+            self.assertEqual(0.0, ships.propulsion_power()[0])
+            self.assertEqual(Ship(5.72, 0.248, 0.76, 1.0, 6.99, 0.613).propulsion_power(), ships.propulsion_power()[1])
+            self.assertEqual(0.0, propulsion_power_batch(5.72, 0.248, 0.76, 0, 6.99, 0.613))
+
+    def test_speed_array(self):
+        r"""
+        test that an array of speeds matches evaluating one ship per speed
+        """
+        speeds = np.array([0.2, 1.0, 2.0, 3.0])
+        expected = [Ship(5.72, 0.248, 0.76, speed, 6.99, 0.613).propulsion_power() for speed in speeds]
+        np.testing.assert_allclose(Ship(5.72, 0.248, 0.76, speeds, 6.99, 0.613).propulsion_power(), expected)
+        self.assertEqual(expected[2], Ship(5.72, 0.248, 0.76, np.array(2.0), 6.99, 0.613).propulsion_power())
+
+    def test_fleet(self):
+        r"""
+        test that the batch API matches evaluating one ship at a time
+        """
+        ships = np.array([[5.72, 0.248, 0.76, 0.2, 6.99, 0.613],
+                          [5.72, 0.248, 0.76, 2.0, 6.99, 0.613],
+                          [40.0, 2.1, 8.0, 6.0, 5.2, 0.71],
+                          [120.0, 6.5, 20.0, 9.0, 7.5, 0.58]])
+        expected = [Ship(*ship).propulsion_power() for ship in ships]
+        np.testing.assert_allclose(propulsion_power_batch(*ships.T), expected)
+
+    def test_parallel_kernels(self):
+        r"""
+        test that the multithreaded element-wise ufuncs for large arrays match the single threaded ones
+        """
+        length, speed = np.full(1000, 5.72), np.linspace(0, 3, 1000)
+        froude_number, frictional_resistance_coef = _kernels.element_wise_kernels('cpu')
+        froude_number_parallel, frictional_resistance_coef_parallel = _kernels.element_wise_kernels('parallel')
+        np.testing.assert_array_equal(froude_number_parallel(speed, length), froude_number(speed, length))
+        np.testing.assert_array_equal(frictional_resistance_coef_parallel(length, speed, 1e-6),
+                                      frictional_resistance_coef(length, speed, 1e-6))
+        self.assertEqual('parallel', _kernels.element_wise_target(length, speed[:, np.newaxis]))
+        self.assertEqual('cpu', _kernels.element_wise_target(length, speed))
+
+    def test_temperature_out_of_range(self):
+        r"""
+        test that sea water temperatures outside of the viscosity table are rejected
+        """
+        for temperature in [-5, 45, np.nan]:
+            with self.assertRaises(ValueError):
+                physics.kinematic_viscosity(temperature)
+        with self.assertRaises(ValueError):
+            vectorized.kinematic_viscosity(np.array([10, 45]))
+
+    def test_residual_resistance_out_of_range(self):
+        r"""
+        test that Froude numbers outside of the table use the nearest tabulated value, for scalars, arrays and ships
+        """
+        table = residual_resistance_table()
+        curve = table[(table[:, 0] == 7.0) & (table[:, 1] == 0.6)]
+        curve = curve[np.argsort(curve[:, 2])]
+        # below and above the (7.0, 0.60) curve, the nearest one to a (6.99, 0.613) hull, and on one of its points
+        queries = np.array([[6.99, 0.613, 0.02], curve[14, :3], [6.99, 0.613, 0.6]])
+        expected = np.array([curve[0, 3], curve[14, 3], curve[-1, 3]]) / 1000
+        for query, value in zip(queries, expected):
+            self.assertAlmostEqual(1, physics.residual_resistance_coef(*query) / value)
+        np.testing.assert_allclose(vectorized.residual_resistance_coef(*queries.T), expected)
+
+        # Froude number 0.027, below the (7.0, 0.60) curve too
+        ship = Ship(5.72, 0.248, 0.76, 0.2, 6.99, 0.613)
+        resistance = 1 / 2 * 1025 * ship.surface_area * 0.2 ** 2 * (physics.frictional_resistance_coef(5.72, 0.2) +
+                                                                   expected[0])
+        self.assertAlmostEqual(1, ship.resistance / resistance)
+
+    def test_residual_resistance_not_finite(self):
+        r"""
+        test that NaN Froude numbers are rejected rather than given the value of an arbitrary tabulated point
+        """
+        with self.assertRaises(ValueError):
+            physics.residual_resistance_coef(6.99, 0.613, np.nan)
+        with self.assertRaises(ValueError):
+            vectorized.residual_resistance_coef(6.99, 0.613, np.array([0.3, np.nan]))
+
+    @skipIf(scipy is None, 'the triangulation beyond the ends of the table curves needs SciPy')
+    def test_residual_resistance_baseline(self):
+        r"""
+        test against scipy.interpolate.LinearNDInterpolator of the table with a NearestNDInterpolator fallback, within
+        the difference of trilinear to Delaunay interpolation, and beyond the Froude numbers of the (4.0, 0.80) curve
+        """
+        expected = {(6.99, 0.613, 0.3): 0.0016398939030303028,
+                    (7.2, 0.72, 0.4): 0.004352613338509318,
+                    (5.5, 0.65, 0.25): 0.0012831455740181267,
+                    (4.0, 0.8, 0.25): 0.00655055041825095,
+                    (4.0, 0.8, 0.3): 0.00847604,
+                    (4.0, 0.8, 0.35): 0.01076882,
+                    (4.0, 0.8, 0.4): 0.00996859,
+                    (4.2, 0.78, 0.3): 0.009710653173020528,
+                    (5.0, 0.7, 0.42): 0.011930619097995547}
+        for point, value in expected.items():
+            self.assertAlmostEqual(1, physics.residual_resistance_coef(*point) / value, delta=5e-3)
+        np.testing.assert_allclose(vectorized.residual_resistance_coef(*np.array(list(expected)).T),
+                                   list(expected.values()), rtol=5e-3)
+
+    @skipIf(scipy is None, 'the triangulation needs SciPy')
+    def test_simplex_cached_interpolator(self):
+        r"""
+        test the cached simplex interpolator of a scattered table against scipy.interpolate.LinearNDInterpolator
+        """
+        rng = np.random.default_rng(0)
+        points, values = rng.random((200, 3)), rng.random(200)
+        linear = interpolation.SimplexCachedInterpolator(points, values)
+        queries = np.vstack([0.5 + 0.01 * rng.standard_normal((20, 3)), rng.uniform(-0.1, 1.1, (20, 3))])
+        expected = scipy.interpolate.LinearNDInterpolator(points, values)(queries)
+        np.testing.assert_allclose([linear(*query) for query in queries], expected)
+        np.testing.assert_allclose(linear(*queries.T), expected)
+
+    def test_point_array_call(self):
+        r"""
+        test the (..., ndim) array of points call form of the SciPy interpolators physics.CR and CRNEAREST replace
+        """
+        points = np.array([[6.99, 0.613, 0.3], [5.5, 0.65, 0.25], [4.0, 0.8, 0.4], [7.0, 0.6, 0.9]])
+        for interpolator in (physics.CR, physics.CRNEAREST):
+            expected = [interpolator(*point) for point in points]
+            np.testing.assert_allclose(interpolator(points), expected)
+            np.testing.assert_allclose(interpolator(tuple(points.T)), expected)
+            np.testing.assert_allclose(interpolator(np.reshape(points, (2, 2, 3))), np.reshape(expected, (2, 2)))
+
+    @skipIf(not hasattr(_cr_pythran, '__pythran__'), 'the Pythran extension is not built')
+    def test_pythran_trilerp(self):
+        r"""
+        test the compiled batch interpolation of the residual resistance grid against the NumPy implementation
+        """
+        linear = physics.residual_resistance_interpolators()[0]
+        rng = np.random.default_rng(0)
+        queries = rng.uniform([3.9, 0.49, 0.1], [8.1, 0.81, 0.5], (1000, 3))
+        expected = linear._multilinear(tuple(queries.T))  # pylint: disable=protected-access
+        np.testing.assert_allclose(linear(*queries.T), expected)
+
+    def test_compile_speed_kernel(self):
+        r"""
+        test that the speed specialised resistance function matches a ship built at each speed
+        """
+        for ship in [Ship(5.72, 0.248, 0.76, 2.0, 6.99, 0.613), Ship(*np.array([5.72, 0.248, 0.76, 2.0, 6.99, 0.613]))]:
+            resistance = ship.compile_speed_kernel()
+            for speed in [0.2, 1.0, 2.0, 3.0]:
+                self.assertAlmostEqual(1, resistance(speed) / Ship(5.72, 0.248, 0.76, speed, 6.99, 0.613).resistance)